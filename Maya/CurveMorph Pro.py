@@ -28,9 +28,32 @@ Usage:
 
 import maya.cmds as cmds
 import maya.mel as mel
+import array
+import base64
+import collections
+import hashlib
+import itertools
 import math
+import operator
+import re
+import sys
 import webbrowser
 import json
+import zlib
+
+# Optional orjson for faster preset (de)serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional NumPy for vectorized keyframe processing
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 # Optional OpenMaya API 2.0 for performance
 try:
@@ -600,6 +623,8 @@ def show_ui():
     """Main function to show the UI"""
     # Clean up any existing callbacks
     remove_preset_selection_callback()
+    remove_slide_callbacks()
+    remove_presets_cache_callbacks()
     
     if cmds.window(WINDOW_NAME, exists=True):
         cmds.deleteUI(WINDOW_NAME)
@@ -611,6 +636,8 @@ def show_ui():
     def on_window_close():
         """Cleanup when window is closed"""
         remove_preset_selection_callback()
+        remove_slide_callbacks()
+        remove_presets_cache_callbacks()
     
     window = cmds.window(
         WINDOW_NAME,
@@ -1040,7 +1067,8 @@ def show_ui():
     
     cmds.rowLayout(numberOfColumns=3, adjustableColumn=1, columnWidth3=[120, 60, 100])
     cmds.text(label=get_text("slide_amount"), align="right")
-    cmds.floatField("slide_amount_field", value=0.05, precision=3, minValue=0.001, maxValue=0.5, width=55)
+    cmds.floatField("slide_amount_field", value=_slide_amount, precision=3, minValue=0.001, maxValue=0.5, width=55,
+                    changeCommand=set_slide_amount, dragCommand=set_slide_amount)
     cmds.text(label="(0-1)")
     cmds.setParent("..")
     
@@ -2833,6 +2861,10 @@ def clean_scene():
                 except:
                     pass
     
+    # Scene nodes backing the in-memory caches are gone
+    invalidate_presets_cache()
+    clear_slide_state()
+    
     cmds.inViewMessage(msg="Scene cleaned! {} nodes deleted.".format(deleted_count), pos="midCenter", fade=True)
 
 
@@ -2880,6 +2912,18 @@ def save_scene_data(key, data):
     cmds.setAttr(attr_name, data_json, type="string")
 
 
+def save_scene_data_multi(data_dict):
+    """Save several keys to the scene network node in one pass"""
+    node = get_data_node()
+    existing = set(cmds.listAttr(node, userDefined=True) or [])
+    
+    for key, data in data_dict.items():
+        if key not in existing:
+            cmds.addAttr(node, longName=key, dataType="string")
+        data_json = json.dumps(data) if data else ""
+        cmds.setAttr("{}.{}".format(node, key), data_json, type="string")
+
+
 def load_scene_data(key, default=None):
     """Load data from the scene network node"""
     node = get_data_node()
@@ -3044,7 +3088,7 @@ def create_backup_locator(obj):
     end = int(cmds.playbackOptions(query=True, maxTime=True))
     
     # Create locator
-    short_name = obj.split("|")[-1].split(":")[-1]
+    short_name = get_short_name(obj)
     loc_name = PREFIX + short_name + "_backup"
     
     if cmds.objExists(loc_name):
@@ -3117,7 +3161,7 @@ def restore_from_backup():
     
     restored = 0
     for obj in sel:
-        short_name = obj.split("|")[-1].split(":")[-1]
+        short_name = get_short_name(obj)
         backup_name = PREFIX + short_name + "_backup"
         
         if cmds.objExists(backup_name):
@@ -3203,6 +3247,30 @@ def sample_curve_position(curve, parameter):
     return pos
 
 
+def get_curve_sampler(curve):
+    """Build a reusable sampler: normalized parameter (0-1) -> world position.
+    
+    With OpenMaya 2.0 the MFnNurbsCurve is created once and reused for every
+    sample; otherwise falls back to sample_curve_position.
+    """
+    if not HAS_OM2:
+        return lambda parameter: sample_curve_position(curve, parameter)
+    
+    shapes = cmds.listRelatives(curve, shapes=True, type="nurbsCurve", fullPath=True)
+    if not shapes:
+        return lambda parameter: None
+    
+    curve_fn = om2.MFnNurbsCurve(get_dag_path(shapes[0]))
+    min_param, max_param = curve_fn.knotDomain
+    
+    def sample(parameter):
+        actual_param = min_param + (max_param - min_param) * parameter
+        point = curve_fn.getPointAtParam(actual_param, om2.MSpace.kWorld)
+        return (point.x, point.y, point.z)
+    
+    return sample
+
+
 def morph_curve_basic():
     """Morph base curve (first selected) to match target curve (second selected)"""
     sel = cmds.ls(selection=True)
@@ -3274,6 +3342,9 @@ def morph_curve_preserve_length():
         dist = math.sqrt(sum((a-b)**2 for a, b in zip(pos1, pos2)))
         distances.append(dist)
     
+    # New joints/distances replace any cached slide data for this curve
+    _curve_slide_cache.pop(base, None)
+    
     # Store distances on base curve
     for i, dist in enumerate(distances):
         attr_name = "storedDist_{}".format(i)
@@ -3307,8 +3378,9 @@ def morph_curve_preserve_length():
     # Position joints on target curve maintaining distances
     target_length = get_curve_length(target)
     if target_length:
+        sample_target = get_curve_sampler(target)
         current_param = 0.0
-        target_pos = sample_curve_position(target, 0)
+        target_pos = sample_target(0)
         if target_pos and joints:
             cmds.xform(joints[0], worldSpace=True, translation=target_pos)
         
@@ -3320,7 +3392,7 @@ def morph_curve_preserve_length():
                 param_increment = target_dist / target_length
                 current_param = min(1.0, current_param + param_increment)
                 
-                next_pos = sample_curve_position(target, current_param)
+                next_pos = sample_target(current_param)
                 if next_pos:
                     cmds.xform(joints[i], worldSpace=True, translation=next_pos)
     
@@ -3335,20 +3407,125 @@ def morph_curve_preserve_length():
 # CURVE SLIDING SYSTEM
 # ============================================================================
 
+# Per-curve slide data with preformatted plug strings
+_curve_slide_cache = {}  # {base_curve: {"joints": [...], "dist_attrs": [...]}}
+_MORPH_JOINT_RE = re.compile(re.escape(PREFIX) + r"cv_(\d+)_joint$")
+
+# In-memory mirror of each curve's slideOffset attribute. Only used while the
+# undo/scene callbacks are installed so it can never go stale.
+_slide_offsets = {}  # {base_curve: offset}
+_slide_callback_ids = []
+_slide_amount = 0.05  # Mirrors slide_amount_field, kept current by its change/drag commands
+
+
+def get_slide_cache(base):
+    """Get cached morph joints and storedDist plugs for a base curve"""
+    entry = _curve_slide_cache.get(base)
+    if entry and len(cmds.ls(entry["joints"]) or []) == len(entry["joints"]):
+        return entry
+    
+    # One ls for all morph joints, then keep the contiguous run from index 0
+    base_cvs = get_curve_cv_count(base)
+    found = {}
+    for jnt_name in cmds.ls(PREFIX + "cv_*_joint") or []:
+        match = _MORPH_JOINT_RE.match(jnt_name.rsplit("|", 1)[-1])
+        if match:
+            found.setdefault(int(match.group(1)), jnt_name)
+    
+    joints = []
+    for i in range(base_cvs if base_cvs else 20):
+        if i not in found:
+            break
+        joints.append(found[i])
+    
+    # One listAttr for all stored distances, same contiguous rule
+    stored = set(cmds.listAttr(base, userDefined=True, string="storedDist_*") or [])
+    dist_attrs = []
+    for i in range(20):
+        attr_name = "storedDist_" + str(i)
+        if attr_name not in stored:
+            break
+        dist_attrs.append(base + "." + attr_name)
+    
+    entry = {"joints": joints, "dist_attrs": dist_attrs}
+    _curve_slide_cache[base] = entry
+    return entry
+
+
 def get_slide_offset(curve):
     """Get stored slide offset for curve"""
+    setup_slide_callbacks()
+    if curve in _slide_offsets:
+        return _slide_offsets[curve]
+    
     if not cmds.attributeQuery("slideOffset", node=curve, exists=True):
         cmds.addAttr(curve, longName="slideOffset", attributeType="double", defaultValue=0.0)
-        return 0.0
-    return cmds.getAttr("{}.slideOffset".format(curve))
+        offset = 0.0
+    else:
+        offset = cmds.getAttr(curve + ".slideOffset")
+    
+    if _slide_callback_ids:
+        _slide_offsets[curve] = offset
+    return offset
 
 
 def set_slide_offset(curve, offset):
     """Set slide offset for curve"""
+    if _slide_offsets.get(curve) == offset:
+        return
+    
     if not cmds.attributeQuery("slideOffset", node=curve, exists=True):
         cmds.addAttr(curve, longName="slideOffset", attributeType="double", defaultValue=offset)
     else:
-        cmds.setAttr("{}.slideOffset".format(curve), offset)
+        cmds.setAttr(curve + ".slideOffset", offset)
+    
+    if _slide_callback_ids:
+        _slide_offsets[curve] = offset
+
+
+def clear_slide_state(*args):
+    """Drop in-memory slide data (scene attributes are the source of truth)"""
+    _slide_offsets.clear()
+    _curve_slide_cache.clear()
+
+
+def setup_slide_callbacks():
+    """Install event callbacks that invalidate in-memory slide data"""
+    if _slide_callback_ids or not HAS_OM2:
+        return
+    
+    for event in ("Undo", "Redo", "SceneOpened", "NewSceneOpened"):
+        try:
+            _slide_callback_ids.append(om2.MEventMessage.addEventCallback(event, clear_slide_state))
+        except Exception as e:
+            cmds.warning("Could not setup slide callback: {}".format(str(e)))
+
+
+def remove_slide_callbacks():
+    """Remove the slide invalidation callbacks"""
+    for callback_id in _slide_callback_ids:
+        try:
+            om2.MMessage.removeCallback(callback_id)
+        except:
+            pass
+    del _slide_callback_ids[:]
+    clear_slide_state()
+
+
+def compute_slide_params(distances, target_length, start_param, joint_count):
+    """Compute normalized target parameters for each slide joint.
+    
+    Pure arithmetic, kept free of Maya calls. The first joint sits at
+    start_param, each following joint advances by its stored distance
+    (clamped to 1.0).
+    """
+    params = [start_param]
+    current_param = start_param
+    for target_dist in distances[:joint_count - 1]:
+        param_increment = target_dist / target_length if target_length else 0.05
+        current_param = min(1.0, current_param + param_increment)
+        params.append(current_param)
+    return params
 
 
 def slide_curve(direction=1, amount=0.05):
@@ -3373,30 +3550,20 @@ def slide_curve(direction=1, amount=0.05):
         cmds.warning("Both selections must be NURBS curves!")
         return False
     
-    # Find joints for this curve
-    base_cvs = get_curve_cv_count(base)
-    joints = []
-    for i in range(base_cvs if base_cvs else 20):
-        jnt_name = PREFIX + "cv_{}_joint".format(i)
-        if cmds.objExists(jnt_name):
-            joints.append(jnt_name)
-        else:
-            break
+    # Find joints and stored distance plugs for this curve
+    slide_data = get_slide_cache(base)
+    joints = slide_data["joints"]
     
     if not joints:
+        _curve_slide_cache.pop(base, None)
         cmds.warning("No morph joints found. Run 'Morph (Keep Length)' first!")
         return False
     
     # Get stored distances
-    distances = []
-    for i in range(20):
-        attr_name = "storedDist_{}".format(i)
-        if cmds.attributeQuery(attr_name, node=base, exists=True):
-            distances.append(cmds.getAttr("{}.{}".format(base, attr_name)))
-        else:
-            break
+    distances = [cmds.getAttr(attr) for attr in slide_data["dist_attrs"]]
     
     if not distances:
+        _curve_slide_cache.pop(base, None)
         cmds.warning("No stored distances found!")
         return False
     
@@ -3421,20 +3588,12 @@ def slide_curve(direction=1, amount=0.05):
         return False
     
     # Move joints
-    current_param = new_offset
-    first_pos = sample_curve_position(target, current_param)
-    if first_pos and joints:
-        cmds.xform(joints[0], worldSpace=True, translation=first_pos)
-    
-    for i in range(1, len(joints)):
-        if i-1 < len(distances):
-            target_dist = distances[i-1]
-            param_increment = target_dist / target_length if target_length else 0.05
-            current_param = min(1.0, current_param + param_increment)
-            
-            next_pos = sample_curve_position(target, current_param)
-            if next_pos:
-                cmds.xform(joints[i], worldSpace=True, translation=next_pos)
+    sample_target = get_curve_sampler(target)
+    params = compute_slide_params(distances, target_length, new_offset, len(joints))
+    for jnt, param in zip(joints, params):
+        pos = sample_target(param)
+        if pos:
+            cmds.xform(jnt, worldSpace=True, translation=pos)
     
     set_slide_offset(base, new_offset)
     cmds.inViewMessage(msg="Slid {} to offset {:.2f}".format(
@@ -3445,30 +3604,43 @@ def slide_curve(direction=1, amount=0.05):
     return True
 
 
+def set_slide_amount(value):
+    """Store the slide amount from the UI field"""
+    global _slide_amount
+    _slide_amount = float(value)
+
+
 def slide_curve_forward():
     """Slide curve forward along target"""
-    amount = 0.05
-    try:
-        amount = cmds.floatField("slide_amount_field", query=True, value=True)
-    except:
-        pass
-    return slide_curve(direction=1, amount=amount)
+    return slide_curve(direction=1, amount=_slide_amount)
 
 
 def slide_curve_backward():
     """Slide curve backward along target"""
-    amount = 0.05
-    try:
-        amount = cmds.floatField("slide_amount_field", query=True, value=True)
-    except:
-        pass
-    return slide_curve(direction=-1, amount=amount)
+    return slide_curve(direction=-1, amount=_slide_amount)
 
 
 # ============================================================================
 # LOCATOR TOOLS
 # ============================================================================
 
+def get_shape_type_map(nodes):
+    """Map each transform (long name) to the node type of its first shape.
+    
+    One listRelatives + one ls query for the whole list instead of
+    listRelatives/nodeType calls per object.
+    """
+    type_map = {}
+    if not nodes:
+        return type_map
+    shapes = cmds.listRelatives(nodes, shapes=True, noIntermediate=True, fullPath=True) or []
+    if shapes:
+        listing = cmds.ls(shapes, showType=True, long=True) or []
+        for shape, shape_type in zip(listing[0::2], listing[1::2]):
+            type_map.setdefault(shape.rsplit("|", 1)[0], shape_type)
+    return type_map
+
+
 def scale_locators(factor):
     """Scale selected locators by factor"""
     sel = cmds.ls(selection=True)
@@ -3476,14 +3648,13 @@ def scale_locators(factor):
         cmds.warning("Please select locators!")
         return
     
-    for obj in sel:
-        shapes = cmds.listRelatives(obj, shapes=True, type="locator")
-        if shapes:
-            for shape in shapes:
-                for axis in ["X", "Y", "Z"]:
-                    attr = "{}.localScale{}".format(shape, axis)
-                    current = cmds.getAttr(attr)
-                    cmds.setAttr(attr, current * factor)
+    # Single query for every locator shape under the selection
+    shapes = cmds.listRelatives(sel, shapes=True, type="locator", fullPath=True) or []
+    for shape in shapes:
+        # Read and write all three components in one call each
+        attr = shape + ".localScale"
+        current = cmds.getAttr(attr)[0]
+        cmds.setAttr(attr, current[0] * factor, current[1] * factor, current[2] * factor, type="double3")
     
     cmds.inViewMessage(msg="Locators scaled!", pos="midCenter", fade=True)
 
@@ -3499,8 +3670,8 @@ def make_locators_smaller():
 
 
 # Color cycle for locators
-LOCATOR_COLORS = [17, 18, 13, 14, 6, 9, 12, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31]
-_color_index = [0]  # Mutable to track state
+LOCATOR_COLORS = (17, 18, 13, 14, 6, 9, 12, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31)
+_color_cycle = itertools.cycle(LOCATOR_COLORS)
 
 
 def cycle_locator_color():
@@ -3510,18 +3681,16 @@ def cycle_locator_color():
         cmds.warning("Please select locators!")
         return
     
-    color = LOCATOR_COLORS[_color_index[0] % len(LOCATOR_COLORS)]
-    _color_index[0] += 1
+    color = next(_color_cycle)
     
-    for obj in sel:
-        shapes = cmds.listRelatives(obj, shapes=True)
-        if shapes:
-            for shape in shapes:
-                cmds.setAttr("{}.overrideEnabled".format(shape), 1)
-                cmds.setAttr("{}.overrideColor".format(shape), color)
-        else:
-            cmds.setAttr("{}.overrideEnabled".format(obj), 1)
-            cmds.setAttr("{}.overrideColor".format(obj), color)
+    # Shapes get the override; objects without shapes get it on the transform
+    shapes = cmds.listRelatives(sel, shapes=True, fullPath=True) or []
+    parents = set(shape.rsplit("|", 1)[0] for shape in shapes)
+    targets = shapes + [obj for obj in cmds.ls(sel, long=True) if obj not in parents]
+    
+    for node in targets:
+        cmds.setAttr(node + ".overrideEnabled", 1)
+        cmds.setAttr(node + ".overrideColor", color)
     
     cmds.inViewMessage(msg="Color changed!", pos="midCenter", fade=True)
 
@@ -3530,6 +3699,27 @@ def cycle_locator_color():
 # MASTER FOLLOW SYSTEM
 # ============================================================================
 
+def get_world_translate_rotate(node):
+    """Get world-space translation and XYZ rotation (degrees) of a node.
+    
+    With OpenMaya 2.0 both come from one world matrix decomposition instead
+    of two xform queries.
+    """
+    if not HAS_OM2:
+        return (cmds.xform(node, query=True, worldSpace=True, translation=True),
+                cmds.xform(node, query=True, worldSpace=True, rotation=True))
+    
+    xform_matrix = om2.MTransformationMatrix(get_dag_path(node).inclusiveMatrix())
+    translation = xform_matrix.translation(om2.MSpace.kWorld)
+    rotation = xform_matrix.rotation()
+    return ([translation.x, translation.y, translation.z],
+            [math.degrees(rotation.x), math.degrees(rotation.y), math.degrees(rotation.z)])
+
+
+# Follower channels added to the master follow animation layer
+FOLLOW_CHANNELS = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ"]
+
+
 def create_master_follow_system():
     """Create a master follow system for selected objects"""
     sel = cmds.ls(selection=True)
@@ -3541,8 +3731,7 @@ def create_master_follow_system():
     followers = sel[1:]
     
     # Store in scene data
-    save_scene_data("masterControl", master)
-    save_scene_data("followerObjects", followers)
+    save_scene_data_multi({"masterControl": master, "followerObjects": followers})
     
     # Create animation layer for master follow
     layer_name = PREFIX + "master_follow_layer"
@@ -3552,11 +3741,18 @@ def create_master_follow_system():
     # Create the layer
     layer = cmds.animLayer(layer_name)
     
-    # Add followers to the layer
+    # Add followers' keyable, unlocked channels to the layer in a single edit
+    layer_attrs = []
     for follower in followers:
-        for attr in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz']:
-            full_attr = "{}.{}".format(follower, attr)
-            if cmds.objExists(full_attr) and not cmds.getAttr(full_attr, lock=True):
+        channels = set(cmds.listAttr(follower, keyable=True, unlocked=True) or [])
+        layer_attrs.extend(follower + "." + attr for attr in FOLLOW_CHANNELS if attr in channels)
+    
+    if layer_attrs:
+        try:
+            cmds.animLayer(layer, edit=True, attribute=layer_attrs)
+        except:
+            # One bad plug fails the whole batch - fall back to per-attribute adds
+            for full_attr in layer_attrs:
                 try:
                     cmds.animLayer(layer, edit=True, attribute=full_attr)
                 except:
@@ -3564,8 +3760,7 @@ def create_master_follow_system():
     
     # Create locator at master position
     master_loc = cmds.spaceLocator(name=PREFIX + "master_follow_loc")[0]
-    pos = cmds.xform(master, query=True, worldSpace=True, translation=True)
-    rot = cmds.xform(master, query=True, worldSpace=True, rotation=True)
+    pos, rot = get_world_translate_rotate(master)
     cmds.xform(master_loc, worldSpace=True, translation=pos, rotation=rot)
     
     # Constrain locator to master
@@ -3575,19 +3770,18 @@ def create_master_follow_system():
     offsets = []
     for follower in followers:
         offset_grp = cmds.group(empty=True, name=follower.split("|")[-1] + "_follow_offset")
-        fpos = cmds.xform(follower, query=True, worldSpace=True, translation=True)
-        frot = cmds.xform(follower, query=True, worldSpace=True, rotation=True)
+        fpos, frot = get_world_translate_rotate(follower)
         cmds.xform(offset_grp, worldSpace=True, translation=fpos, rotation=frot)
         
         # Constrain to master locator
         cmds.parentConstraint(master_loc, offset_grp, maintainOffset=True)
         
-        # Add influence attribute
-        cmds.addAttr(offset_grp, longName="followInfluence", attributeType="double", 
-                    defaultValue=1.0, minValue=0.0, maxValue=1.0, keyable=True)
-        
         offsets.append(offset_grp)
     
+    # Add influence attribute to all offset groups at once
+    cmds.addAttr(offsets, longName="followInfluence", attributeType="double", 
+                defaultValue=1.0, minValue=0.0, maxValue=1.0, keyable=True)
+    
     # Group everything
     grp = cmds.group([master_loc] + offsets, name=PREFIX + "master_follow_grp")
     
@@ -3608,8 +3802,7 @@ def remove_master_follow_system():
     if cmds.objExists(layer):
         cmds.delete(layer)
     
-    save_scene_data("masterControl", "")
-    save_scene_data("followerObjects", [])
+    save_scene_data_multi({"masterControl": "", "followerObjects": []})
     
     cmds.inViewMessage(msg="Master follow system removed!", pos="midCenter", fade=True)
 
@@ -3631,9 +3824,10 @@ def add_cv_controls_with_count(cv_count=10):
         cmds.warning("Selection is not a NURBS curve!")
         return
     
-    # Rebuild curve to desired CV count
-    cmds.rebuildCurve(curve, constructionHistory=False, replaceOriginal=True,
-                     spans=cv_count - 3, degree=3, keepRange=1, keepEndPoints=True)
+    # Rebuild curve to desired CV count (skip when it is already a cubic with that count)
+    if cmds.getAttr(curve + ".degree") != 3 or get_curve_cv_count(curve) != cv_count:
+        cmds.rebuildCurve(curve, constructionHistory=False, replaceOriginal=True,
+                         spans=cv_count - 3, degree=3, keepRange=1, keepEndPoints=True)
     
     # Now create CV controls using existing function
     create_cv_controls(curve)
@@ -3645,6 +3839,40 @@ def add_cv_controls_with_count(cv_count=10):
 # ATTACH TO SURFACE SYSTEM
 # ============================================================================
 
+def get_dag_path(node):
+    """Get an OpenMaya 2.0 MDagPath for a node name"""
+    sel_list = om2.MSelectionList()
+    sel_list.add(node)
+    return sel_list.getDagPath(0)
+
+
+def get_closest_point_sampler(surface_shape, surface_type):
+    """Build a closest-point function for a mesh or NURBS surface shape.
+    
+    The function set is created once and reused for every query.
+    Returns a callable taking a world-space MPoint and returning the closest
+    world-space MPoint on the surface.
+    """
+    surface_path = get_dag_path(surface_shape)
+    
+    if surface_type == "mesh":
+        # Build the intersector's acceleration structure once for all queries
+        world_matrix = surface_path.inclusiveMatrix()
+        intersector = om2.MMeshIntersector()
+        intersector.create(surface_path.node(), world_matrix)
+        
+        def closest_point(point):
+            # MPointOnMesh.point is in object space
+            return om2.MPoint(intersector.getClosestPoint(point).point) * world_matrix
+    else:
+        surface_fn = om2.MFnNurbsSurface(surface_path)
+        
+        def closest_point(point):
+            return surface_fn.closestPoint(point, space=om2.MSpace.kWorld)[0]
+    
+    return closest_point
+
+
 def attach_objects_to_surface():
     """Project curve CV controls onto a surface - snaps them to the surface perfectly.
     
@@ -3663,7 +3891,7 @@ def attach_objects_to_surface():
     surface = sel[-1]
     sources = sel[:-1]
     
-    surface_shapes = cmds.listRelatives(surface, shapes=True, noIntermediate=True)
+    surface_shapes = cmds.listRelatives(surface, shapes=True, noIntermediate=True, fullPath=True)
     if not surface_shapes:
         cmds.warning("Last selection must be a mesh or NURBS surface!")
         return
@@ -3676,31 +3904,22 @@ def attach_objects_to_surface():
     
     # Collect all objects to project
     objects_to_project = []
+    source_types = get_shape_type_map(sources)
     
     for src in sources:
-        shapes = cmds.listRelatives(src, shapes=True, noIntermediate=True, fullPath=True) or []
+        shape_type = source_types.get(src)
         
-        if shapes:
-            shape_type = cmds.nodeType(shapes[0])
+        if shape_type == "nurbsCurve":
+            if cmds.attributeQuery("cvControlGroup", node=src, exists=True):
+                grp_name = cmds.getAttr(src + ".cvControlGroup")
+                if grp_name and cmds.objExists(grp_name):
+                    children = cmds.listRelatives(grp_name, children=True, type="transform", fullPath=True) or []
+                    child_types = get_shape_type_map(children)
+                    objects_to_project.extend(c for c in children if child_types.get(c) == "locator")
             
-            if shape_type == "locator":
-                objects_to_project.append(src)
-            
-            elif shape_type == "nurbsCurve":
-                if cmds.attributeQuery("cvControlGroup", node=src, exists=True):
-                    grp_name = cmds.getAttr(src + ".cvControlGroup")
-                    if grp_name and cmds.objExists(grp_name):
-                        children = cmds.listRelatives(grp_name, children=True, type="transform") or []
-                        for child in children:
-                            child_shapes = cmds.listRelatives(child, shapes=True)
-                            if child_shapes and cmds.nodeType(child_shapes[0]) == "locator":
-                                objects_to_project.append(child)
-                
-                if not objects_to_project:
-                    cmds.warning("Curve has no CV controls! Use 'Create CV Controls' first.")
-                    return
-            else:
-                objects_to_project.append(src)
+            if not objects_to_project:
+                cmds.warning("Curve has no CV controls! Use 'Create CV Controls' first.")
+                return
         else:
             objects_to_project.append(src)
     
@@ -3713,12 +3932,30 @@ def attach_objects_to_surface():
     try:
         projected_count = 0
         
-        # Create a clean duplicate of the surface for constraining
-        temp_surface = cmds.duplicate(surface, returnRootsOnly=True)[0]
-        temp_surface = cmds.rename(temp_surface, PREFIX + "projection_surface")
-        cmds.makeIdentity(temp_surface, apply=True, translate=True, rotate=True, scale=True)
-        cmds.delete(temp_surface, constructionHistory=True)
+        if HAS_OM2:
+            # Query closest points straight from the API - no constraints or redraws
+            closest_point = get_closest_point_sampler(surface_shape, surface_type)
+            for obj in objects_to_project:
+                if not cmds.objExists(obj):
+                    continue
+                try:
+                    pos = cmds.xform(obj, query=True, worldSpace=True, translation=True)
+                    pt = closest_point(om2.MPoint(pos))
+                    # xform keeps the move inside the undo chunk
+                    cmds.xform(obj, worldSpace=True, translation=(pt.x, pt.y, pt.z))
+                    projected_count += 1
+                except Exception as e:
+                    cmds.warning("Could not project {}: {}".format(obj, str(e)))
+            
+            if projected_count > 0:
+                cmds.inViewMessage(msg="Projected {} controls onto surface!".format(projected_count), 
+                                 pos="midCenter", fade=True)
+            else:
+                cmds.warning("Failed to project any objects!")
+            return
         
+        # Constrain straight to the surface - the constraint reads its world-space
+        # geometry, so no frozen duplicate is needed
         for obj in objects_to_project:
             if not cmds.objExists(obj):
                 continue
@@ -3726,12 +3963,11 @@ def attach_objects_to_surface():
             try:
                 # Use geometry constraint - Maya's native way to snap to surface
                 # This is the most reliable method
-                constraint = cmds.geometryConstraint(temp_surface, obj, weight=1.0)
+                constraint = cmds.geometryConstraint(surface, obj, weight=1.0)
                 
                 if constraint:
-                    # Force evaluation
+                    # Force evaluation (no viewport refresh needed to read the result)
                     cmds.dgeval(obj)
-                    cmds.refresh(force=True)
                     
                     # Get the new position after constraint
                     new_pos = cmds.xform(obj, query=True, worldSpace=True, translation=True)
@@ -3747,10 +3983,6 @@ def attach_objects_to_surface():
                 cmds.warning("Could not project {}: {}".format(obj, str(e)))
                 continue
         
-        # Delete temp surface
-        if cmds.objExists(temp_surface):
-            cmds.delete(temp_surface)
-        
         if projected_count > 0:
             cmds.inViewMessage(msg="Projected {} controls onto surface!".format(projected_count), 
                              pos="midCenter", fade=True)
@@ -3759,12 +3991,6 @@ def attach_objects_to_surface():
             
     except Exception as e:
         cmds.warning("Project to surface failed: {}".format(str(e)))
-        # Cleanup
-        if cmds.objExists(PREFIX + "projection_surface"):
-            try:
-                cmds.delete(PREFIX + "projection_surface")
-            except:
-                pass
     finally:
         cmds.undoInfo(closeChunk=True)
         cmds.select(sources)
@@ -3772,7 +3998,7 @@ def attach_objects_to_surface():
 
 def detach_objects_from_surface():
     """Reset - restore curve from snapshot if available, or clean up any leftover constraints"""
-    sel = cmds.ls(selection=True)
+    sel = cmds.ls(selection=True, long=True)
     if not sel:
         cmds.warning("Select a curve to reset!")
         return
@@ -3781,15 +4007,17 @@ def detach_objects_from_surface():
     
     try:
         reset_count = 0
+        sel_types = get_shape_type_map(sel)
+        objects_to_check = []
         
         for obj in sel:
             if not cmds.objExists(obj):
                 continue
             
-            shapes = cmds.listRelatives(obj, shapes=True, noIntermediate=True) or []
+            is_curve = sel_types.get(obj) == "nurbsCurve"
             
             # If it's a curve with a snapshot, restore it
-            if shapes and cmds.nodeType(shapes[0]) == "nurbsCurve":
+            if is_curve:
                 if cmds.attributeQuery("snapshotData", node=obj, exists=True):
                     snapshot_data = cmds.getAttr(obj + ".snapshotData")
                     if snapshot_data and snapshot_data.strip():
@@ -3798,35 +4026,43 @@ def detach_objects_from_surface():
                         reset_count += 1
                         continue
             
-            # Clean up any leftover geometry constraints
-            objects_to_check = [obj]
+            # Collect everything that may carry leftover geometry constraints
+            objects_to_check.append(obj)
             
-            if shapes and cmds.nodeType(shapes[0]) == "nurbsCurve":
+            if is_curve:
                 if cmds.attributeQuery("cvControlGroup", node=obj, exists=True):
                     grp_name = cmds.getAttr(obj + ".cvControlGroup")
                     if grp_name and cmds.objExists(grp_name):
-                        children = cmds.listRelatives(grp_name, children=True, type="transform") or []
+                        children = cmds.listRelatives(grp_name, children=True, type="transform", fullPath=True) or []
                         objects_to_check.extend(children)
-            
-            for check_obj in objects_to_check:
-                if not cmds.objExists(check_obj):
-                    continue
+        
+        # Clean up leftover geometry constraints in one batch
+        # (cmds.ls([]) lists the whole scene, so never pass it an empty list)
+        if objects_to_check:
+            objects_to_check = cmds.ls(objects_to_check, long=True) or []
+        if objects_to_check:
+            try:
+                constraints = cmds.listRelatives(objects_to_check, children=True,
+                                                 type="geometryConstraint", fullPath=True) or []
+                connected = cmds.listConnections(objects_to_check, type="geometryConstraint") or []
+                if connected:
+                    constraints += cmds.ls(connected, long=True) or []
+                constraints = list(set(constraints))
                 
-                try:
-                    constraints = cmds.listRelatives(check_obj, type="geometryConstraint") or []
-                    connections = cmds.listConnections(check_obj, type="geometryConstraint") or []
-                    constraints.extend(connections)
-                    constraints = list(set(constraints))
-                    
-                    if constraints:
+                if constraints:
+                    constrained = cmds.listRelatives(constraints, parent=True, fullPath=True) or []
+                    try:
+                        cmds.delete(constraints)
+                    except:
+                        # one bad name fails the whole batch; fall back per constraint
                         for c in constraints:
                             try:
                                 cmds.delete(c)
                             except:
                                 pass
-                        reset_count += 1
-                except:
-                    pass
+                    reset_count += len(set(constrained))
+            except:
+                pass
         
         # Clean up temp surfaces
         temp_surfaces = cmds.ls(PREFIX + "temp_surface*", type="transform") or []
@@ -3851,11 +4087,82 @@ def detach_objects_from_surface():
 # ANIMATION PRESETS SYSTEM - Controller-Based Presets
 # ============================================================================
 
+# Transform channels captured in animation presets
+PRESET_ATTRS = ("tx", "ty", "tz", "rx", "ry", "rz")
+
+# Preset keyframe storage: v1 = [[time, value], ...] lists,
+# v2 = {"blob": base64 little-endian float64 (times then values), "count": n}
+PRESET_FORMAT_VERSION = 2
+
+# Marks zlib-compressed, base64-wrapped preset attribute payloads
+PRESET_COMPRESSED_PREFIX = "gz:"
+
+# How preset values combine with existing animation (None = overwrite)
+PRESET_BLEND_OPS = {"replace": None, "additive": operator.add, "multiply": operator.mul}
+
 # Global preset storage
 _animation_presets = {}  # {controller_key: {preset_name: preset_data}}
 _preset_list_ui = None
 _current_controller_key = None
 _selection_callback_id = None
+_refresh_pending = False
+_short_name_cache = {}  # {full_name: short_name}
+_label_cache = {}  # {(controller_key, preset_name, frame_count): list label}
+_controller_key_cache = {}  # {frozenset(selection): controller_key}
+
+# Parsed presets stay valid until the scene changes under them. Only trusted
+# while the invalidation callbacks are installed.
+_presets_cache_valid = False
+_presets_callback_ids = []
+_saved_group_hashes = {}  # {group attribute: hash of the payload known to be on the node}
+_legacy_presets_pending = False  # presetsData blob still holds unmigrated presets
+
+
+def fast_json_loads(data):
+    """Parse JSON text/bytes, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def fast_json_dumps(data):
+    """Serialize to a JSON string, using orjson when available"""
+    if HAS_ORJSON:
+        # OPT_NON_STR_KEYS matches json.dumps, which coerces non-string keys
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data)
+
+
+def encode_keys(times, values):
+    """Pack keyframe times and values into a base64 float64 blob"""
+    if HAS_NUMPY:
+        raw = np.concatenate((np.asarray(times, dtype="<f8"), np.asarray(values, dtype="<f8"))).tobytes()
+    else:
+        packed = array.array("d", list(times) + list(values))
+        if sys.byteorder == "big":
+            packed.byteswap()
+        raw = packed.tobytes()
+    return {"blob": base64.b64encode(raw).decode("ascii"), "count": len(times)}
+
+
+def decode_keys(key_data):
+    """Unpack preset keys into (times, values) lists - reads v1 and v2 formats"""
+    if not isinstance(key_data, dict):
+        return [float(k) for k, _ in key_data], [float(v) for _, v in key_data]
+    
+    raw = base64.b64decode(key_data["blob"])
+    if HAS_NUMPY:
+        flat = np.frombuffer(raw, dtype="<f8").tolist()
+    else:
+        packed = array.array("d")
+        packed.frombytes(raw)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        flat = packed.tolist()
+    count = key_data.get("count", len(flat) // 2)
+    return flat[:count], flat[count:2 * count]
 
 
 def get_presets_node():
@@ -3873,42 +4180,165 @@ def get_presets_node():
     return node_name
 
 
+def invalidate_presets_cache(*args):
+    """Force the next load_presets_from_scene to re-read the scene node"""
+    global _presets_cache_valid
+    _presets_cache_valid = False
+    _saved_group_hashes.clear()
+
+
+def setup_presets_cache_callbacks():
+    """Install event callbacks that invalidate the parsed presets cache"""
+    if _presets_callback_ids or not HAS_OM2:
+        return
+    
+    for event in ("Undo", "Redo", "SceneOpened", "NewSceneOpened"):
+        try:
+            _presets_callback_ids.append(om2.MEventMessage.addEventCallback(event, invalidate_presets_cache))
+        except Exception as e:
+            cmds.warning("Could not setup presets callback: {}".format(str(e)))
+
+
+def remove_presets_cache_callbacks():
+    """Remove the presets cache callbacks"""
+    for callback_id in _presets_callback_ids:
+        try:
+            om2.MMessage.removeCallback(callback_id)
+        except:
+            pass
+    del _presets_callback_ids[:]
+    invalidate_presets_cache()
+
+
+def compress_preset_payload(data):
+    """Compress a JSON payload into a "gz:"-prefixed base64 zlib string"""
+    return PRESET_COMPRESSED_PREFIX + base64.b64encode(zlib.compress(data.encode("utf-8"), 1)).decode("ascii")
+
+
+def decompress_preset_payload(data):
+    """Inverse of compress_preset_payload; plain JSON passes through unchanged"""
+    if data and data.startswith(PRESET_COMPRESSED_PREFIX):
+        return zlib.decompress(base64.b64decode(data[len(PRESET_COMPRESSED_PREFIX):])).decode("utf-8")
+    return data
+
+
+def get_preset_group_attr(controller_key):
+    """Name of the presets node attribute storing one controller set's presets"""
+    return "presets_" + hashlib.md5(controller_key.encode("utf-8")).hexdigest()[:12]
+
+
 def load_presets_from_scene():
-    """Load all presets from scene into memory"""
-    global _animation_presets
+    """Load all presets from scene into memory (cached until the scene changes)
+    
+    Each controller set lives in its own presets_<hash> string attribute.
+    The legacy presetsData blob is still read; group attributes override it.
+    """
+    global _animation_presets, _presets_cache_valid, _legacy_presets_pending
+    setup_presets_cache_callbacks()
+    if _presets_cache_valid and cmds.objExists(PREFIX + "presets_node"):
+        return _animation_presets
+    
     node = get_presets_node()
+    _saved_group_hashes.clear()
+    _legacy_presets_pending = False
+    presets = {}
     try:
+        # Legacy storage: every controller set in one blob
         data = cmds.getAttr("{}.presetsData".format(node))
         if data and data.strip():
             try:
-                loaded = json.loads(data)
+                loaded = fast_json_loads(decompress_preset_payload(data))
                 # Validate structure
                 if isinstance(loaded, dict):
-                    _animation_presets = loaded
-                else:
-                    _animation_presets = {}
-            except (json.JSONDecodeError, ValueError) as e:
+                    presets.update(loaded)
+                    _legacy_presets_pending = bool(loaded)
+            except (json.JSONDecodeError, ValueError, zlib.error) as e:
                 cmds.warning("Preset data corrupted, resetting: {}".format(str(e)))
-                _animation_presets = {}
-        else:
-            _animation_presets = {}
+        
+        # Per controller set storage
+        for attr in cmds.listAttr(node, userDefined=True, string="presets_*") or []:
+            raw = cmds.getAttr("{}.{}".format(node, attr))
+            try:
+                raw = decompress_preset_payload(raw)
+                group = fast_json_loads(raw) if raw and raw.strip() else None
+            except (json.JSONDecodeError, ValueError, zlib.error) as e:
+                cmds.warning("Preset group {} corrupted, skipping: {}".format(attr, str(e)))
+                continue
+            if not isinstance(group, dict) or not group.get("controller_key"):
+                continue
+            
+            controller_key = group["controller_key"]
+            group_presets = group.get("presets")
+            if isinstance(group_presets, dict) and group_presets:
+                presets[controller_key] = group_presets
+            else:
+                # An empty group records a deleted controller set
+                presets.pop(controller_key, None)
+            _saved_group_hashes[attr] = hash(raw)
     except Exception as e:
         cmds.warning("Failed to load presets: {}".format(str(e)))
-        _animation_presets = {}
+    
+    _animation_presets = presets
+    _presets_cache_valid = bool(_presets_callback_ids)
     return _animation_presets
 
 
-def save_presets_to_scene():
-    """Save all presets from memory to scene"""
-    global _animation_presets
+def save_presets_to_scene(controller_key=None):
+    """Save presets from memory to scene
+    
+    With a controller_key only that controller set's attribute is written;
+    without one (or while legacy data is still pending migration) every set
+    is written and the legacy presetsData blob is cleared.
+    """
+    global _animation_presets, _presets_cache_valid, _legacy_presets_pending
     try:
+        if not cmds.objExists(PREFIX + "presets_node"):
+            # Node was removed behind our back - nothing on it can be trusted
+            _saved_group_hashes.clear()
         node = get_presets_node()
-        data = json.dumps(_animation_presets)
-        cmds.setAttr("{}.presetsData".format(node), data, type="string")
+        full_save = controller_key is None or _legacy_presets_pending
+        keys = list(_animation_presets) if full_save else [controller_key]
+        existing_attrs = set(cmds.listAttr(node, userDefined=True, string="presets_*") or [])
+        written_attrs = set()
+        
+        for key in keys:
+            attr = get_preset_group_attr(key)
+            written_attrs.add(attr)
+            data = fast_json_dumps({"controller_key": key, "presets": _animation_presets.get(key, {})})
+            data_hash = hash(data)
+            
+            # Attribute already holds this exact payload - skip the write (and its undo entry)
+            if _presets_cache_valid and _saved_group_hashes.get(attr) == data_hash:
+                continue
+            
+            if attr not in existing_attrs:
+                cmds.addAttr(node, longName=attr, dataType="string")
+            cmds.setAttr("{}.{}".format(node, attr), compress_preset_payload(data), type="string")
+            _saved_group_hashes[attr] = data_hash
+        
+        if full_save:
+            # Drop groups that no longer exist, then retire the legacy blob
+            for attr in existing_attrs - written_attrs:
+                cmds.deleteAttr(node, attribute=attr)
+                _saved_group_hashes.pop(attr, None)
+            cmds.setAttr("{}.presetsData".format(node), "{}", type="string")
+            _legacy_presets_pending = False
+        
+        _presets_cache_valid = bool(_presets_callback_ids)
     except Exception as e:
+        _presets_cache_valid = False
+        _saved_group_hashes.clear()
         cmds.warning("Failed to save presets: {}".format(str(e)))
 
 
+def get_short_name(name):
+    """Strip DAG path and namespace from a node name (memoized)"""
+    short = _short_name_cache.get(name)
+    if short is None:
+        short = _short_name_cache[name] = name.rpartition("|")[2].rpartition(":")[2]
+    return short
+
+
 def generate_controller_key(objects):
     """Generate a unique key for a set of controllers
     
@@ -3918,17 +4348,19 @@ def generate_controller_key(objects):
     if not objects:
         return None
     
-    # Get short names (without namespace and path)
-    short_names = []
-    for obj in objects:
-        short = obj.split("|")[-1]  # Remove path
-        if ":" in short:
-            short = short.split(":")[-1]  # Remove namespace
-        short_names.append(short)
+    selection_id = frozenset(objects)
+    key = _controller_key_cache.get(selection_id)
+    if key is not None:
+        return key
+    
+    # Sort short names (without namespace and path) to create consistent key
+    short_names = sorted(get_short_name(obj) for obj in objects)
+    key = "|".join(short_names)
     
-    # Sort and join to create consistent key
-    short_names.sort()
-    return "|".join(short_names)
+    if len(_controller_key_cache) >= 256:
+        _controller_key_cache.clear()
+    _controller_key_cache[selection_id] = key
+    return key
 
 
 def get_current_controller_key():
@@ -3973,22 +4405,19 @@ def validate_selection_for_preset():
     if not valid_objects:
         return False, "No valid objects in selection!"
     
-    # Check if objects have animation
+    # Check if objects have animation - one keyframe count query per object
+    # covering all transform channels
     has_anim = False
     for obj in valid_objects:
         try:
-            # Check for keyframes on any transform attributes
-            for attr in ["tx", "ty", "tz", "rx", "ry", "rz"]:
-                full_attr = "{}.{}".format(obj, attr)
-                if cmds.objExists(full_attr):
-                    keys = cmds.keyframe(full_attr, query=True) or []
-                    if keys:
-                        has_anim = True
-                        break
-            if has_anim:
+            if cmds.keyframe(obj, attribute=list(PRESET_ATTRS), query=True, keyframeCount=True):
+                has_anim = True
                 break
         except:
-            continue
+            # e.g. a node missing one of the channels: fall back to any anim curve
+            if cmds.listConnections(obj, type="animCurve", s=True, d=False):
+                has_anim = True
+                break
     
     if not has_anim:
         return False, "Selected objects have no animation!"
@@ -4024,69 +4453,69 @@ def extract_animation_data(objects, start_frame, end_frame):
         "frame_range": [start_frame, end_frame],
         "frame_count": int(end_frame - start_frame + 1),
         "created": cmds.date(format="DD/MM/YYYY HH:mm"),
-        "attributes": ["tx", "ty", "tz", "rx", "ry", "rz"]
+        "attributes": list(PRESET_ATTRS),
+        "format_version": PRESET_FORMAT_VERSION
     }
     
-    attrs = ["tx", "ty", "tz", "rx", "ry", "rz"]
-    current_time = cmds.currentTime(query=True)
+    # Local bindings for the per-attribute loop
+    keyframes_data = anim_data["keyframes"]
+    object_names = anim_data["object_names"]
+    full_names = anim_data["full_names"]
+    start_f = float(start_frame)
     
-    try:
-        for obj in objects:
-            if not cmds.objExists(obj):
+    # Objects come from validate_selection_for_preset, which already checked existence
+    for obj in objects:
+        short_name = get_short_name(obj)
+        
+        object_names.append(short_name)
+        full_names.append(obj)
+        obj_keys = keyframes_data[short_name] = {}
+        # One listAttr per object; PRESET_ATTRS are short names
+        obj_attrs = set(cmds.listAttr(obj, shortNames=True) or [])
+        
+        for attr in PRESET_ATTRS:
+            if attr not in obj_attrs:
                 continue
+            full_attr = "{}.{}".format(obj, attr)
             
-            short_name = obj.split("|")[-1]
-            if ":" in short_name:
-                short_name = short_name.split(":")[-1]
-            
-            anim_data["object_names"].append(short_name)
-            anim_data["full_names"].append(obj)
-            anim_data["keyframes"][short_name] = {}
-            
-            for attr in attrs:
-                full_attr = "{}.{}".format(obj, attr)
-                if not cmds.objExists(full_attr):
+            # Skip locked attributes
+            try:
+                if cmds.getAttr(full_attr, lock=True):
                     continue
+            except:
+                pass
+            
+            # Get keyframe data within range
+            try:
+                keys = cmds.keyframe(full_attr, query=True, time=(start_frame, end_frame), 
+                                    timeChange=True) or []
+                values = cmds.keyframe(full_attr, query=True, time=(start_frame, end_frame),
+                                      valueChange=True) or []
                 
-                # Skip locked attributes
-                try:
-                    if cmds.getAttr(full_attr, lock=True):
-                        continue
-                except:
-                    pass
-                
-                # Get keyframe data within range
-                try:
-                    keys = cmds.keyframe(full_attr, query=True, time=(start_frame, end_frame), 
-                                        timeChange=True) or []
-                    values = cmds.keyframe(full_attr, query=True, time=(start_frame, end_frame),
-                                          valueChange=True) or []
-                    
-                    if keys and values and len(keys) == len(values):
-                        # Normalize times relative to start
-                        normalized = [(float(k - start_frame), float(v)) for k, v in zip(keys, values)]
-                        anim_data["keyframes"][short_name][attr] = normalized
+                if keys and values and len(keys) == len(values):
+                    # Normalize times relative to start
+                    if HAS_NUMPY:
+                        times = np.asarray(keys, dtype=np.float64) - start_f
                     else:
-                        # Sample the animation if no keyframes in range
-                        sampled = []
-                        for frame in range(int(start_frame), int(end_frame) + 1):
-                            try:
-                                cmds.currentTime(frame)
-                                val = cmds.getAttr(full_attr)
-                                sampled.append((float(frame - start_frame), float(val)))
-                            except:
-                                pass
-                        if sampled:
-                            anim_data["keyframes"][short_name][attr] = sampled
-                except Exception as e:
-                    # Skip this attribute if we can't read it
-                    pass
-    finally:
-        # Always restore current time
-        try:
-            cmds.currentTime(current_time)
-        except:
-            pass
+                        times = [k - start_f for k in keys]
+                    obj_keys[attr] = encode_keys(times, values)
+                else:
+                    # Sample the animation if no keyframes in range - evaluate at each
+                    # frame without moving the current time (no scene re-evaluation)
+                    times = []
+                    sampled = []
+                    for frame in range(int(start_frame), int(end_frame) + 1):
+                        try:
+                            val = cmds.getAttr(full_attr, time=frame)
+                            times.append(frame - start_f)
+                            sampled.append(float(val))
+                        except:
+                            pass
+                    if sampled:
+                        obj_keys[attr] = encode_keys(times, sampled)
+            except Exception as e:
+                # Skip this attribute if we can't read it
+                pass
     
     return anim_data
 
@@ -4142,7 +4571,8 @@ def save_animation_preset(preset_name, start_frame, end_frame):
         
         # Save to memory and scene
         _animation_presets[controller_key][preset_name] = anim_data
-        save_presets_to_scene()
+        save_presets_to_scene(controller_key)
+        _label_cache.clear()
         
         cmds.inViewMessage(msg=get_text("preset_saved") + " '{}'".format(preset_name), 
                           pos="midCenter", fade=True)
@@ -4191,6 +4621,12 @@ def apply_animation_preset(preset_name, target_start_frame, target_end_frame=Non
     
     preset = _animation_presets[controller_key][preset_name]
     
+    # Resolve the blend operation once for the whole apply
+    if blend_mode not in PRESET_BLEND_OPS:
+        cmds.warning("Unknown blend mode: {}".format(blend_mode))
+        return False
+    blend_op = PRESET_BLEND_OPS[blend_mode]
+    
     # Validate target frame range
     if target_start_frame is None or target_start_frame < 0:
         cmds.warning("Invalid target start frame!")
@@ -4207,36 +4643,40 @@ def apply_animation_preset(preset_name, target_start_frame, target_end_frame=Non
         target_duration = target_end_frame - target_start_frame
         time_scale = float(target_duration) / float(preset_frame_count - 1) if preset_frame_count > 1 else 1.0
     
-    current_time = cmds.currentTime(query=True)
     cmds.waitCursor(state=True)
     cmds.undoInfo(openChunk=True)
     
+    # Keep auto-key, cycle checking and viewport redraws out of the key writes
+    prev_auto_key = cmds.autoKeyframe(query=True, state=True)
+    prev_cycle_check = cmds.cycleCheck(query=True, evaluation=True)
+    cmds.autoKeyframe(state=False)
+    cmds.cycleCheck(evaluation=False)
+    cmds.refresh(suspend=True)
+    
     try:
         applied_count = 0
         failed_attrs = []
         
+        # Selection comes straight from cmds.ls, so every object exists
         for obj in sel:
-            if not cmds.objExists(obj):
-                continue
-            
-            short_name = obj.split("|")[-1]
-            if ":" in short_name:
-                short_name = short_name.split(":")[-1]
+            short_name = get_short_name(obj)
             
             # Find matching data - exact match required for same controllers
             if short_name not in preset["keyframes"]:
                 continue
             
             obj_data = preset["keyframes"][short_name]
+            # One listAttr per object; presets store short attribute names
+            obj_attrs = set(cmds.listAttr(obj, shortNames=True) or [])
             
             # Apply keyframes
             for attr, keyframes in obj_data.items():
                 if not keyframes:
                     continue
                 
-                full_attr = "{}.{}".format(obj, attr)
-                if not cmds.objExists(full_attr):
+                if attr not in obj_attrs:
                     continue
+                full_attr = "{}.{}".format(obj, attr)
                 
                 # Check if locked
                 try:
@@ -4246,39 +4686,24 @@ def apply_animation_preset(preset_name, target_start_frame, target_end_frame=Non
                     pass
                 
                 try:
-                    for rel_frame, value in keyframes:
-                        # Apply time scaling
-                        scaled_frame = rel_frame * time_scale
-                        actual_frame = target_start_frame + scaled_frame
-                        
-                        if blend_mode == "replace":
-                            cmds.setKeyframe(obj, attribute=attr, time=actual_frame, value=float(value))
-                        elif blend_mode == "additive":
-                            cmds.currentTime(actual_frame)
-                            try:
-                                current = cmds.getAttr(full_attr)
-                                cmds.setKeyframe(obj, attribute=attr, time=actual_frame, value=float(current + value))
-                            except:
-                                pass
-                        elif blend_mode == "multiply":
-                            cmds.currentTime(actual_frame)
-                            try:
-                                current = cmds.getAttr(full_attr)
-                                cmds.setKeyframe(obj, attribute=attr, time=actual_frame, value=float(current * value))
-                            except:
-                                pass
+                    # Apply time scaling
+                    rel_times, values = decode_keys(keyframes)
+                    times = [target_start_frame + rel_frame * time_scale for rel_frame in rel_times]
+                    
+                    # Blend against the existing animation, read at each time without
+                    # moving the current time (all reads happen before any new keys)
+                    if blend_op is not None:
+                        current = [cmds.getAttr(full_attr, time=t) for t in times]
+                        values = list(map(blend_op, current, values))
+                    
+                    for actual_frame, value in zip(times, values):
+                        cmds.setKeyframe(obj, attribute=attr, time=actual_frame, value=value)
                 except Exception as e:
                     failed_attrs.append("{}.{}".format(short_name, attr))
                     continue
             
             applied_count += 1
         
-        # Restore time
-        try:
-            cmds.currentTime(current_time)
-        except:
-            pass
-        
         if applied_count > 0:
             if target_end_frame is not None and target_end_frame > target_start_frame:
                 actual_end = int(target_end_frame)
@@ -4299,10 +4724,9 @@ def apply_animation_preset(preset_name, target_start_frame, target_end_frame=Non
         cmds.warning("Failed to apply preset: {}".format(str(e)))
         return False
     finally:
-        try:
-            cmds.currentTime(current_time)
-        except:
-            pass
+        cmds.refresh(suspend=False)
+        cmds.cycleCheck(evaluation=prev_cycle_check)
+        cmds.autoKeyframe(state=prev_auto_key)
         cmds.undoInfo(closeChunk=True)
         cmds.waitCursor(state=False)
 
@@ -4325,7 +4749,8 @@ def delete_animation_preset(preset_name):
         if not _animation_presets[controller_key]:
             del _animation_presets[controller_key]
         
-        save_presets_to_scene()
+        save_presets_to_scene(controller_key)
+        _label_cache.clear()
         cmds.inViewMessage(msg="Preset '{}' deleted".format(preset_name), pos="midCenter", fade=True)
         refresh_preset_list_ui()
         return True
@@ -4393,8 +4818,12 @@ def export_presets_for_controllers():
             "export_date": cmds.date(format="DD/MM/YYYY HH:mm"),
             "version": TOOL_VERSION
         }
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if HAS_ORJSON:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
         cmds.inViewMessage(msg="Presets exported to {}".format(file_path.split("\\")[-1]), pos="midCenter", fade=True)
     except IOError as e:
         cmds.warning("Export failed - file access error: {}".format(str(e)))
@@ -4424,8 +4853,8 @@ def import_presets_for_controllers():
     file_path = file_path[0]
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            import_data = json.load(f)
+        with open(file_path, 'rb') as f:
+            import_data = fast_json_loads(f.read())
         
         # Validate import data structure
         if not isinstance(import_data, dict):
@@ -4445,8 +4874,12 @@ def import_presets_for_controllers():
             cmds.warning("Invalid preset data structure!")
             return
         
-        count = 0
         skipped = 0
+        target_presets = _animation_presets[controller_key]
+        pairs = []
+        # Snapshot of every taken name (existing + already imported)
+        existing = set(target_presets)
+        suffix_counters = collections.defaultdict(int)
         
         for name, data in imported_presets.items():
             # Validate preset data structure
@@ -4459,20 +4892,21 @@ def import_presets_for_controllers():
                 skipped += 1
                 continue
             
-            if name not in _animation_presets[controller_key]:
-                _animation_presets[controller_key][name] = data
-                count += 1
-            else:
-                # Add suffix for duplicates
-                counter = 1
-                new_name = name + "_imported"
-                while new_name in _animation_presets[controller_key]:
-                    new_name = name + "_imported_{}".format(counter)
-                    counter += 1
-                _animation_presets[controller_key][new_name] = data
-                count += 1
+            new_name = name
+            while new_name in existing:
+                # Add suffix for duplicates: name_imported, name_imported_1, ...
+                counter = suffix_counters[name]
+                suffix_counters[name] += 1
+                new_name = name + ("_imported_{}".format(counter) if counter else "_imported")
+            existing.add(new_name)
+            pairs.append((new_name, data))
         
-        save_presets_to_scene()
+        # Insert everything in one sized update instead of key-by-key growth
+        target_presets.update(pairs)
+        count = len(pairs)
+        
+        save_presets_to_scene(controller_key)
+        _label_cache.clear()
         refresh_preset_list_ui()
         
         msg = "Imported {} presets".format(count)
@@ -4523,22 +4957,23 @@ def refresh_preset_list_ui(*args):
         
         if not presets:
             cmds.textScrollList(_preset_list_ui, edit=True, 
-                               append="[ No presets for these controllers ]")
-            cmds.textScrollList(_preset_list_ui, edit=True, 
-                               append="[ Save a new preset below ]")
+                               append=["[ No presets for these controllers ]",
+                                       "[ Save a new preset below ]"])
             return
         
-        # Add presets to list
+        # Add presets to list in a single edit
+        labels = []
         for name in sorted(presets.keys()):
-            try:
-                preset = presets[name]
-                if not isinstance(preset, dict):
-                    continue
-                frame_count = preset.get("frame_count", "?")
-                label = "{} ({} frames)".format(name, frame_count)
-                cmds.textScrollList(_preset_list_ui, edit=True, append=label)
-            except:
+            preset = presets[name]
+            if not isinstance(preset, dict):
                 continue
+            label_key = (controller_key, name, preset.get("frame_count", "?"))
+            label = _label_cache.get(label_key)
+            if label is None:
+                label = _label_cache[label_key] = "{} ({} frames)".format(name, label_key[2])
+            labels.append(label)
+        if labels:
+            cmds.textScrollList(_preset_list_ui, edit=True, append=labels)
     except Exception as e:
         # Silently fail to avoid breaking UI
         pass
@@ -4585,6 +5020,27 @@ def update_preset_info_ui(*args):
         pass
 
 
+def schedule_preset_list_refresh(*args):
+    """Coalesce a burst of SelectionChanged events into one deferred refresh"""
+    global _refresh_pending
+    if _refresh_pending:
+        return
+    _refresh_pending = True
+    cmds.evalDeferred(run_scheduled_preset_refresh, lowestPriority=True)
+
+
+def run_scheduled_preset_refresh():
+    """Run the pending preset list refresh if the controller set changed"""
+    global _refresh_pending
+    _refresh_pending = False
+    
+    # Re-selecting the same controllers leaves the list as it is; explicit
+    # refreshes (save/delete/import, Refresh button) call refresh_preset_list_ui directly
+    if get_current_controller_key() == _current_controller_key:
+        return
+    refresh_preset_list_ui()
+
+
 def setup_preset_selection_callback():
     """Setup callback to refresh preset list when selection changes"""
     global _selection_callback_id
@@ -4596,7 +5052,7 @@ def setup_preset_selection_callback():
         import maya.api.OpenMaya as om
         _selection_callback_id = om.MEventMessage.addEventCallback(
             "SelectionChanged", 
-            lambda *args: cmds.evalDeferred(refresh_preset_list_ui)
+            schedule_preset_list_refresh
         )
     except Exception as e:
         cmds.warning("Could not setup selection callback: {}".format(str(e)))
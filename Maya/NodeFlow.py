@@ -14,8 +14,13 @@
 ╚══════════════════════════════════════════════════════════════════════╝
 """
 
+import re
+import sys
 import webbrowser
 from collections import defaultdict
+from contextlib import contextmanager
+from itertools import chain
+from operator import itemgetter
 import maya.cmds as cmds
 
 try:
@@ -29,6 +34,12 @@ except ImportError:
 
 import maya.OpenMayaUI as omui
 
+try:
+    import maya.api.OpenMaya as om2
+    HAS_OM2 = True
+except ImportError:
+    HAS_OM2 = False
+
 MAYA_VERSION = int(cmds.about(version=True).split(".")[0])
 
 # ══════════════════════════════════════════════════════════════════════
@@ -290,6 +301,14 @@ NODE_CONVERSION_TABLE = {
     },
 }
 
+# Flat view of NODE_CONVERSION_TABLE: (node_type, renderer) -> conversion,
+# so each lookup is one hash instead of two chained .get() calls.
+CONVERSION_BY_TYPE_RENDERER = {
+    (node_type, renderer): conversion
+    for node_type, by_renderer in NODE_CONVERSION_TABLE.items()
+    for renderer, conversion in by_renderer.items()
+}
+
 # Bump/normal chain: node types that output to shader normal/bump slots.
 # Used to ensure converted bump node output is always wired to shader.
 BUMP_NODE_TYPES = frozenset([
@@ -320,7 +339,7 @@ NORMAL_MAP_FILENAME_SUBSTRINGS = (
 
 def file_texture_name_is_normal(file_node):
     """Return True if the file node's texture path suggests a normal map."""
-    if not file_node or cmds.nodeType(file_node) != "file":
+    if not file_node or get_node_type(file_node) != "file":
         return False
     try:
         path = cmds.getAttr("%s.fileTextureName" % file_node) or ""
@@ -353,7 +372,7 @@ def find_first_bump_node_upstream(start_plug, max_depth=50):
     if not start_plug:
         return None
     visited = set()
-    start_node = start_plug.split(".")[0]
+    start_node = start_plug.partition(".")[0]
     queue = [start_node]
     depth = 0
     while queue and depth < max_depth:
@@ -361,16 +380,15 @@ def find_first_bump_node_upstream(start_plug, max_depth=50):
         if node in visited:
             continue
         visited.add(node)
-        ntype = cmds.nodeType(node)
+        ntype = get_node_type(node)
         if ntype in BUMP_NODE_TYPES:
             return node
-        ups = cmds.listConnections(node, source=True, destination=False) or []
-        queue.extend(ups)
+        queue.extend(get_upstream_nodes(node))
         depth += 1
     return None
 
 
-PASSTHROUGH_NODES = {
+PASSTHROUGH_NODES = frozenset({
     "file", "place2dTexture",
     "remapValue", "remapColor", "remapHsv",
     "multiplyDivide", "clamp", "reverse",
@@ -379,7 +397,7 @@ PASSTHROUGH_NODES = {
     "layeredTexture", "gammaCorrect",
     "hsvToRgb", "rgbToHsv",
     "unitConversion", "luminance",
-}
+})
 
 # ══════════════════════════════════════════════════════════════════════
 #  RENDERER / MATERIAL LISTS
@@ -409,6 +427,12 @@ RENDERER_MATERIALS = {
 
 RENDERER_OPTIONS = list(RENDERER_MATERIALS.keys())
 
+# Reverse lookup: material type -> renderer (first renderer listing it wins).
+MAT_TYPE_TO_RENDERER = {}
+for _renderer, _mats in RENDERER_MATERIALS.items():
+    for _mat in _mats:
+        MAT_TYPE_TO_RENDERER.setdefault(_mat, _renderer)
+
 SUPPORTED_SOURCES = [
     "aiStandardSurface", "standardSurface",
     "lambert", "blinn", "phong", "phongE",
@@ -940,54 +964,455 @@ _VALUE_KEYS = [
 ]
 VALUE_MAP = {k: MASTER_MAP[k] for k in _VALUE_KEYS if k in MASTER_MAP}
 
+# "Boring default" values collect_data does not bother transferring:
+# black colors (except on the main color slots) and zero emission/SSS/coat.
+_ZERO_COLOR_KEEP = frozenset(["baseColor", "color", "specularColor"])
+_ZERO_FLOAT_SKIP = frozenset(["emission", "subsurface", "coat"])
+
+
+def _never_skip(val):
+    return False
+
+
+def _is_zero_color(val):
+    return isinstance(val, list) and bool(val) and isinstance(val[0], tuple) \
+        and val[0] == (0.0, 0.0, 0.0)
+
+
+def _is_zero_color_or_float(val):
+    return _is_zero_color(val) or (isinstance(val, float) and val == 0.0)
+
+
+# src_attr -> predicate(value) -> True when the value should be skipped
+SKIP_DEFAULT_VALUE = {
+    k: _never_skip if k in _ZERO_COLOR_KEEP else
+       _is_zero_color_or_float if k in _ZERO_FLOAT_SKIP else
+       _is_zero_color
+    for k in VALUE_MAP
+}
+
+# MASTER_MAP inverted by target material: mat_type -> {src_attr: (attr, out)}
+# so collect_data only visits the slots the target actually supports.
+MASTER_MAP_BY_TARGET = defaultdict(dict)
+for _src_attr, _target_map in MASTER_MAP.items():
+    for _mat_type, _slot in _target_map.items():
+        MASTER_MAP_BY_TARGET[_mat_type][_src_attr] = _slot
+MASTER_MAP_BY_TARGET = dict(MASTER_MAP_BY_TARGET)
+
 
 # ══════════════════════════════════════════════════════════════════════
 #  HELPERS
 # ══════════════════════════════════════════════════════════════════════
 
+# Read-only graph queries go through API 2.0 when available (no MEL command
+# dispatch per call); anything that edits the scene stays on cmds for undo.
+
+def get_mobject(node):
+    """Return the MObject for a node name, or None."""
+    try:
+        sel = om2.MSelectionList()
+        sel.add(node)
+        return sel.getDependNode(0)
+    except Exception:
+        return None
+
+
+def _api_node_name(mobj):
+    # interned: these names are reused as keys in every traversal cache
+    if mobj.hasFn(om2.MFn.kDagNode):
+        return sys.intern(om2.MFnDagNode(mobj).partialPathName())
+    return sys.intern(om2.MFnDependencyNode(mobj).name())
+
+
+# Node types / attribute existence memoized for the duration of one graph
+# walk (see traversal_cache). Live connections are not cached because the
+# converter rewires the graph while it walks it; only the incoming edges of
+# source networks primed by prime_upstream_graph are reused, since the
+# converter never connects INTO an existing source node.
+_type_cache = None
+_attr_cache = None
+_upstream_graph = None   # {node: [(src_plug, dst_attr), ...]}
+_live_nodes = None       # nodes known to exist (seen or created this walk)
+_plug_sources = None     # {dst_plug: src_plug} known connections this walk
+_primed_dst_nodes = None # nodes whose every incoming connection is in _plug_sources
+
+
+@contextmanager
+def traversal_cache():
+    """Memoize get_node_type / has_attr / node_exists / primed upstream edges
+    inside the with-block."""
+    global _type_cache, _attr_cache, _upstream_graph, _live_nodes
+    global _plug_sources, _primed_dst_nodes
+    if _type_cache is not None:
+        yield   # nested: reuse the outer cache
+        return
+    _type_cache, _attr_cache, _upstream_graph, _plug_sources = {}, {}, {}, {}
+    _live_nodes, _primed_dst_nodes = set(), set()
+    try:
+        yield
+    finally:
+        _type_cache = _attr_cache = _upstream_graph = _live_nodes = None
+        _plug_sources = _primed_dst_nodes = None
+
+
+def node_exists(node):
+    """cmds.objExists, skipped for nodes already confirmed during this walk."""
+    if _live_nodes is None:
+        return cmds.objExists(node)
+    if node in _live_nodes:
+        return True
+    if cmds.objExists(node):
+        _live_nodes.add(node)
+        return True
+    return False
+
+
+def prime_live_nodes(nodes):
+    """Confirm many nodes with a single ls call (inside traversal_cache only)."""
+    if _live_nodes is None:
+        return
+    nodes = [n for n in nodes if n and n not in _live_nodes]
+    if nodes:
+        _live_nodes.update(cmds.ls(nodes) or [])
+
+
+def prime_connections(node):
+    """Record every incoming connection of node with one listConnections call."""
+    if _plug_sources is None or not node or node in _primed_dst_nodes:
+        return
+    pairs = cmds.listConnections(node, connections=True, plugs=True,
+                                 source=True, destination=False) or []
+    for i in range(0, len(pairs) - 1, 2):
+        _plug_sources[pairs[i]] = pairs[i + 1]
+    _primed_dst_nodes.add(node)
+
+
+def is_connected(src, dst):
+    """cmds.isConnected, answered from the connections recorded this walk.
+    Post-wire verification must call cmds.isConnected directly: _safe_connect
+    records its own wires here, so this would always agree with it."""
+    if _plug_sources is None:
+        return cmds.isConnected(src, dst)
+    known = _plug_sources.get(dst)
+    if known is not None:
+        return known == src
+    if dst.partition(".")[0] in _primed_dst_nodes:
+        return False
+    if cmds.isConnected(src, dst):
+        _plug_sources[dst] = src
+        return True
+    return False
+
+
+def mark_live(node):
+    """Record a node created during this walk so node_exists skips it."""
+    if _live_nodes is not None:
+        _live_nodes.add(node)
+    return node
+
+
+def prime_upstream_graph(root):
+    """
+    Record the incoming connections of every node upstream of root with one
+    MItDependencyGraph walk, so get_upstream_nodes / get_upstream_plugs
+    answer from memory instead of querying each node.
+    """
+    if _upstream_graph is None or not HAS_OM2 or root in _upstream_graph:
+        return
+    root_obj = get_mobject(root)
+    if root_obj is None:
+        return
+    it = om2.MItDependencyGraph(root_obj, om2.MFn.kInvalid,
+                                om2.MItDependencyGraph.kUpstream,
+                                om2.MItDependencyGraph.kDepthFirst,
+                                om2.MItDependencyGraph.kNodeLevel)
+    while not it.isDone():
+        mobj = it.currentNode()
+        it.next()
+        name = _api_node_name(mobj)
+        if name in _upstream_graph:
+            continue
+        edges = []
+        for plug in om2.MFnDependencyNode(mobj).getConnections():
+            sources = plug.connectedTo(True, False)
+            if not sources:
+                continue
+            dst_attr = plug.partialName(useLongNames=True)
+            for src in sources:
+                edges.append((
+                    "%s.%s" % (_api_node_name(src.node()),
+                               src.partialName(useLongNames=True)),
+                    dst_attr,
+                ))
+        _upstream_graph[name] = edges
+
+
+def _query_node_type(node):
+    if HAS_OM2:
+        mobj = get_mobject(node)
+        if mobj is not None:
+            return om2.MFnDependencyNode(mobj).typeName
+    return cmds.nodeType(node)
+
+
+def get_node_type(node):
+    if _type_cache is None:
+        return _query_node_type(node)
+    nt = _type_cache.get(node)
+    if nt is None:
+        nt = _type_cache[node] = _query_node_type(node)
+    return nt
+
+
+def get_node_types(nodes):
+    """{node: type} for many nodes with a single ls -showType call."""
+    nodes = list(nodes)
+    if not nodes:
+        return {}
+    pairs = cmds.ls(nodes, showType=True) or []
+    types = dict(zip(pairs[0::2], pairs[1::2]))
+    if _type_cache is not None:
+        _type_cache.update(types)
+    return types
+
+
+def _query_has_attr(node, attr):
+    if HAS_OM2:
+        mobj = get_mobject(node)
+        if mobj is None:
+            return False
+        return om2.MFnDependencyNode(mobj).hasAttribute(attr)
+    return cmds.attributeQuery(attr, node=node, exists=True)
+
+
+def has_attr(node, attr):
+    if _attr_cache is None:
+        return _query_has_attr(node, attr)
+    key = (node, attr)
+    found = _attr_cache.get(key)
+    if found is None:
+        found = _attr_cache[key] = _query_has_attr(node, attr)
+    return found
+
+
+def prime_attrs(node, attrs):
+    """Answer has_attr for many attributes of node from one function set
+    (inside traversal_cache only)."""
+    if _attr_cache is None or not HAS_OM2:
+        return
+    attrs = [a for a in attrs if (node, a) not in _attr_cache]
+    if not attrs:
+        return
+    mobj = get_mobject(node)
+    if mobj is None:
+        return   # has_attr reports it per attribute as before
+    fn = om2.MFnDependencyNode(mobj)
+    for attr in attrs:
+        _attr_cache[(node, attr)] = fn.hasAttribute(attr)
+
+
+def get_upstream_nodes(node):
+    """Nodes feeding any input of node (like listConnections source=True)."""
+    if _upstream_graph and node in _upstream_graph:
+        return [src_plug.partition(".")[0] for src_plug, _ in _upstream_graph[node]]
+    if not HAS_OM2:
+        return cmds.listConnections(node, source=True, destination=False) or []
+    mobj = get_mobject(node)
+    if mobj is None:
+        return []
+    result = []
+    for plug in om2.MFnDependencyNode(mobj).getConnections():
+        for src in plug.connectedTo(True, False):
+            result.append(_api_node_name(src.node()))
+    return result
+
+
+def get_upstream_plugs(node, attr):
+    """Source plugs driving node.attr (like listConnections plugs=True).
+    Returns [] when the attribute does not exist."""
+    if _upstream_graph and node in _upstream_graph:
+        return [src_plug for src_plug, dst_attr in _upstream_graph[node]
+                if dst_attr == attr]
+    if not HAS_OM2:
+        try:
+            return cmds.listConnections("%s.%s" % (node, attr), **_LC_KWARGS) or []
+        except (RuntimeError, ValueError):
+            return []
+    mobj = get_mobject(node)
+    if mobj is None:
+        return []
+    try:
+        plug = om2.MFnDependencyNode(mobj).findPlug(attr, False)
+    except Exception:
+        return []
+    return [
+        "%s.%s" % (_api_node_name(src.node()), src.partialName(useLongNames=True))
+        for src in plug.connectedTo(True, False)
+    ]
+
+
+def get_string_attr(node, attr):
+    if HAS_OM2:
+        mobj = get_mobject(node)
+        if mobj is not None:
+            try:
+                return om2.MFnDependencyNode(mobj).findPlug(attr, False).asString()
+            except Exception:
+                pass
+    return cmds.getAttr("%s.%s" % (node, attr)) or ""
+
+
+_all_node_types = None   # frozenset, reset on plugin load/unload
+
+
+def get_all_node_types():
+    """cmds.allNodeTypes() as a frozenset, fetched once until reset."""
+    global _all_node_types
+    if _all_node_types is None:
+        _all_node_types = frozenset(cmds.allNodeTypes() or ())
+    return _all_node_types
+
+
+def reset_node_type_cache(*args):
+    global _all_node_types
+    _all_node_types = None
+
+
+def add_plugin_callbacks():
+    """Reset the node type cache whenever a plug-in is loaded or unloaded."""
+    if not HAS_OM2:
+        return []
+    ids = []
+    for msg in (om2.MSceneMessage.kAfterPluginLoad,
+                om2.MSceneMessage.kAfterPluginUnload):
+        try:
+            ids.append(om2.MSceneMessage.addStringArrayCallback(
+                msg, reset_node_type_cache))
+        except Exception:
+            pass
+    return ids
+
+
+def remove_callbacks(ids):
+    for cb_id in ids:
+        try:
+            om2.MMessage.removeCallback(cb_id)
+        except Exception:
+            pass
+
+
+@contextmanager
+def batch_edit(chunk_name):
+    """Group scene edits into one undo chunk with viewport refresh suspended."""
+    cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+    cmds.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+
+
+@contextmanager
+def wait_cursor():
+    """Show the busy cursor while a long main-thread operation runs."""
+    QtWidgets.QApplication.setOverrideCursor(QtGui.QCursor(Qt.WaitCursor))
+    try:
+        yield
+    finally:
+        QtWidgets.QApplication.restoreOverrideCursor()
+
+
 def get_renderer_from_mat_type(mat_type):
-    for renderer, mats in RENDERER_MATERIALS.items():
-        if mat_type in mats:
-            return renderer
-    return "Maya"
+    return MAT_TYPE_TO_RENDERER.get(mat_type, "Maya")
 
 
-def _lc_kwargs():
-    kw = dict(source=True, destination=False, plugs=True)
-    if MAYA_VERSION >= 2024:
-        kw["fullNodeName"] = True
-    return kw
+# listConnections flags for "source plugs driving this plug"; built once.
+_LC_KWARGS = dict(source=True, destination=False, plugs=True)
+if MAYA_VERSION >= 2024:
+    _LC_KWARGS["fullNodeName"] = True
 
 
 def get_exact_source_plug(shader, attr):
-    conns = cmds.listConnections(f"{shader}.{attr}", **_lc_kwargs()) or []
+    conns = get_upstream_plugs(shader, attr)
     return conns[0] if conns else None
 
 
-def walk_upstream_for_file(node, visited=None):
-    if visited is None:
-        visited = set()
-    if node in visited:
-        return []
-    visited.add(node)
-    if cmds.nodeType(node) == "file":
-        return [node]
-    results = []
-    for up in (cmds.listConnections(node, source=True, destination=False) or []):
-        results += walk_upstream_for_file(up, visited)
-    return results
-
+def walk_upstream_for_file(node):
+    """Return the first file node found upstream of node (depth-first), or None."""
+    visited = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        if get_node_type(node) == "file":
+            return node
+        # reversed so nodes are visited in listConnections order
+        stack.extend(reversed(get_upstream_nodes(node)))
+    return None
 
-def get_shader_from_mesh(mesh):
-    sgs = cmds.listConnections(mesh, type="shadingEngine") or []
-    shaders = []
-    for sg in sgs:
-        s = cmds.listConnections(sg + ".surfaceShader") or []
-        shaders += s
-    return list(set(shaders))
 
+class ShadingIndex(object):
+    """
+    Shading-group connections for the whole scene, gathered once: which SGs
+    each node is connected to and which shader drives each SG. Set members
+    are queried lazily per SG. Build one per batch action; it does not track
+    later scene edits.
+    """
 
-def get_meshes_from_shader(shader):
+    def __init__(self):
+        self.sgs_by_node = defaultdict(list)
+        self.surface_by_sg = {}
+        self._members_by_sg = {}
+        for sg in cmds.ls(type="shadingEngine") or []:
+            # indexed under both shape and transform names; the direct
+            # query in get_shader_from_mesh expands transforms to match
+            connected = (cmds.listConnections(sg, shapes=True) or []) + \
+                        (cmds.listConnections(sg) or [])
+            for node in dict.fromkeys(connected):
+                self.sgs_by_node[node].append(sg)
+            self.surface_by_sg[sg] = \
+                cmds.listConnections(sg + ".surfaceShader") or []
+
+    def members(self, sg):
+        members = self._members_by_sg.get(sg)
+        if members is None:
+            members = self._members_by_sg[sg] = cmds.sets(sg, q=True) or []
+        return members
+
+    def forget_members(self, sg):
+        """Drop the cached members of sg after its membership was edited."""
+        self._members_by_sg.pop(sg, None)
+
+    def shaders_of(self, mesh):
+        shaders = []
+        for sg in self.sgs_by_node.get(mesh, ()):
+            shaders += self.surface_by_sg.get(sg, [])
+        return list(dict.fromkeys(shaders))
+
+    def meshes_of(self, shader):
+        meshes = []
+        for sg in self.sgs_by_node.get(shader, ()):
+            meshes += self.members(sg)
+        return meshes
+
+
+def get_shader_from_mesh(mesh, index=None):
+    if index is not None:
+        return index.shaders_of(mesh)
+    # SGs connect to the shape; expand a transform so it resolves like the index
+    nodes = [mesh] + (cmds.listRelatives(mesh, shapes=True, fullPath=True) or [])
+    shaders = set()
+    for sg in set(cmds.listConnections(nodes, type="shadingEngine") or ()):
+        shaders.update(cmds.listConnections(sg + ".surfaceShader") or ())
+    return list(shaders)
+
+
+def get_meshes_from_shader(shader, index=None):
+    if index is not None:
+        return index.meshes_of(shader)
     sgs = cmds.listConnections(shader, type="shadingEngine") or []
     meshes = []
     for sg in sgs:
@@ -996,30 +1421,118 @@ def get_meshes_from_shader(shader):
     return meshes
 
 
+_scene_shaders = None         # cached get_all_scene_shaders() result
+_scene_shader_callbacks = []  # cache is only trusted while these are live
+
+
 def get_all_scene_shaders():
-    found = []
-    for t in SUPPORTED_SOURCES:
-        found += cmds.ls(type=t) or []
-    return list(set(found))
+    global _scene_shaders
+    if _scene_shaders is not None and _scene_shader_callbacks:
+        return list(_scene_shaders)
+    # one scene walk for all types; ls already returns each node once
+    found = cmds.ls(type=SUPPORTED_SOURCES) or []
+    _scene_shaders = tuple(found)
+    return found
+
+
+def reset_scene_shader_cache(*args):
+    global _scene_shaders
+    _scene_shaders = None
+
+
+def add_scene_shader_callbacks():
+    """Drop the scene shader cache whenever a supported shader is created,
+    deleted or renamed, or the scene / undo stack changes under it.
+    Returns the callback ids so the owning window can remove them."""
+    if not HAS_OM2 or _scene_shader_callbacks:
+        return []
+    reset = reset_scene_shader_cache
+    ids = []
+    for node_type in SUPPORTED_SOURCES:
+        for add_cb in (om2.MDGMessage.addNodeAddedCallback,
+                       om2.MDGMessage.addNodeRemovedCallback):
+            try:
+                ids.append(add_cb(reset, node_type))
+            except Exception:
+                pass   # renderer plug-in not loaded: type unknown
+    try:
+        ids.append(om2.MNodeMessage.addNameChangedCallback(
+            om2.MObject.kNullObj, reset))
+        for event in ("Undo", "Redo", "SceneOpened", "NewSceneOpened"):
+            ids.append(om2.MEventMessage.addEventCallback(event, reset))
+    except Exception:
+        remove_callbacks(ids)
+        return []
+    reset_scene_shader_cache()
+    _scene_shader_callbacks.extend(ids)
+    return ids
+
+
+def remove_scene_shader_callbacks(ids):
+    remove_callbacks(ids)
+    del _scene_shader_callbacks[:]
+    reset_scene_shader_cache()
+
+
+_selection = None             # cached get_selection() result
+_selection_callbacks = []     # cache is only trusted while these are live
+
+
+def get_selection():
+    global _selection
+    if _selection is not None and _selection_callbacks:
+        return list(_selection)
+    found = cmds.ls(sl=True) or []
+    _selection = tuple(found)
+    return found
+
+
+def reset_selection_cache(*args):
+    global _selection
+    _selection = None
+
+
+def add_selection_callbacks():
+    """Drop the selection cache whenever the selection or a name changes.
+    Returns the callback ids so the owning window can remove them."""
+    if not HAS_OM2 or _selection_callbacks:
+        return []
+    ids = []
+    try:
+        for event in ("SelectionChanged", "NameChanged"):
+            ids.append(om2.MEventMessage.addEventCallback(
+                event, reset_selection_cache))
+    except Exception:
+        remove_callbacks(ids)
+        return []
+    reset_selection_cache()
+    _selection_callbacks.extend(ids)
+    return ids
+
+
+def remove_selection_callbacks(ids):
+    remove_callbacks(ids)
+    del _selection_callbacks[:]
+    reset_selection_cache()
 
 
 def get_available_materials(renderer):
-    all_types = set(cmds.allNodeTypes() or [])
+    all_types = get_all_node_types()
     mats = RENDERER_MATERIALS.get(renderer, [])
     available = [m for m in mats if m in all_types or m == "MASH"]
     return available if available else mats
 
 
 def auto_suggest_target(shaders):
-    votes = defaultdict(int)
+    votes = {}
+    types = get_node_types(shaders)
     for shader in shaders:
-        stype = cmds.nodeType(shader)
-        suggestion = AUTO_SUGGEST.get(stype)
-        if suggestion:
-            votes[suggestion] += 1
+        suggestion = AUTO_SUGGEST.get(types.get(shader))
+        if suggestion is not None:
+            votes[suggestion] = votes.get(suggestion, 0) + 1
     if not votes:
         return "Arnold", "aiStandardSurface"
-    return max(votes, key=votes.get)
+    return max(votes.items(), key=itemgetter(1))[0]
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -1033,17 +1546,19 @@ def auto_suggest_target(shaders):
 def _safe_connect(src, dst, log=None):
     """Connect src → dst safely, log result."""
     try:
-        if not cmds.objExists(src.split(".")[0]):
+        if not node_exists(src.partition(".")[0]):
             if log is not None:
                 log.append("  [SKIP] Source gone: %s" % src)
             return False
-        if not cmds.objExists(dst.split(".")[0]):
+        if not node_exists(dst.partition(".")[0]):
             if log is not None:
                 log.append("  [SKIP] Dest gone: %s" % dst)
             return False
-        if cmds.isConnected(src, dst):
+        if is_connected(src, dst):
             return True
         cmds.connectAttr(src, dst, force=True)
+        if _plug_sources is not None:
+            _plug_sources[dst] = src
         if log is not None:
             log.append("  [WIRE] %s  →  %s" % (src, dst))
         return True
@@ -1064,25 +1579,25 @@ def convert_and_wire(source_plug, target_plug, target_renderer, cache, log,
     """
     if not source_plug or not target_plug:
         return False
-    src_node = source_plug.split(".")[0]
-    src_attr = source_plug.split(".", 1)[1] if "." in source_plug else source_plug
-    if not cmds.objExists(src_node):
+    src_node = sys.intern(source_plug.partition(".")[0])
+    src_attr = source_plug.partition(".")[2] if "." in source_plug else source_plug
+    if not node_exists(src_node):
         log.append("  [SKIP] Source node gone: %s" % src_node)
         return False
-    dst_node = target_plug.split(".")[0]
-    dst_attr = target_plug.split(".", 1)[1] if "." in target_plug else target_plug
-    if not cmds.objExists(dst_node):
+    dst_node = target_plug.partition(".")[0]
+    dst_attr = target_plug.partition(".")[2] if "." in target_plug else target_plug
+    if not node_exists(dst_node):
         log.append("  [SKIP] Target node gone: %s" % target_plug)
         return False
 
-    node_type = cmds.nodeType(src_node)
+    node_type = get_node_type(src_node)
 
     # Coerce file plug when destination is a bump node's .input (e.g. RedshiftBumpMap)
     # Normal => file.outColor, height => file.outAlpha to avoid datatype mismatch.
     if (node_type == "file" and dst_attr == "input" and
-            cmds.nodeType(dst_node) in BUMP_NODE_TYPES):
+            get_node_type(dst_node) in BUMP_NODE_TYPES):
         is_normal = False
-        if cmds.nodeType(dst_node) == "RedshiftBumpMap":
+        if get_node_type(dst_node) == "RedshiftBumpMap":
             try:
                 if cmds.getAttr("%s.inputType" % dst_node) == 1:
                     is_normal = True
@@ -1091,13 +1606,13 @@ def convert_and_wire(source_plug, target_plug, target_renderer, cache, log,
         if not is_normal:
             is_normal = file_texture_name_is_normal(src_node)
         source_plug = get_file_plug_for_bump_mode(src_node, is_normal)
-        src_attr = source_plug.split(".", 1)[1]
-        if is_normal and cmds.nodeType(dst_node) == "RedshiftBumpMap":
+        src_attr = source_plug.partition(".")[2]
+        if is_normal and get_node_type(dst_node) == "RedshiftBumpMap":
             try:
                 cmds.setAttr("%s.inputType" % dst_node, 1)
             except Exception:
                 pass
-    conversion = NODE_CONVERSION_TABLE.get(node_type, {}).get(target_renderer)
+    conversion = CONVERSION_BY_TYPE_RENDERER.get((node_type, target_renderer))
     is_passthrough = node_type in PASSTHROUGH_NODES
     same_type = conversion and conversion.get("type") == node_type
 
@@ -1108,9 +1623,9 @@ def convert_and_wire(source_plug, target_plug, target_renderer, cache, log,
         if conversion and new_node != src_node:
             out_map = conversion.get("outputs", {})
             out_attr = out_map.get(src_attr, src_attr)
-            if target_is_bump_slot and cmds.nodeType(new_node) in BUMP_NODE_TYPES:
+            if target_is_bump_slot and get_node_type(new_node) in BUMP_NODE_TYPES:
                 out_attr = CANONICAL_OUTPUT_BY_BUMP_TYPE.get(
-                    cmds.nodeType(new_node), out_attr
+                    get_node_type(new_node), out_attr
                 )
         elif target_is_bump_slot and node_type in BUMP_NODE_TYPES and new_node == src_node:
             out_attr = CANONICAL_OUTPUT_BY_BUMP_TYPE.get(node_type, src_attr)
@@ -1153,15 +1668,15 @@ def convert_and_wire(source_plug, target_plug, target_renderer, cache, log,
             log.append("  [ERROR] Not connected: %s -> %s" % (out_plug, target_plug))
         return ok
 
-    if new_type not in (cmds.allNodeTypes() or []):
+    if new_type not in get_all_node_types():
         log.append("  [WARN] Node type '%s' not in Maya — keeping '%s'" % (new_type, node_type))
         cache[src_node] = src_node
         ok = _safe_connect(source_plug, target_plug, log)
         return ok
 
     # ── Create new node ──
-    new_node = cmds.shadingNode(new_type, asUtility=True,
-                                name=src_node + "_conv")
+    new_node = mark_live(sys.intern(cmds.shadingNode(new_type, asUtility=True,
+                                                     name=src_node + "_conv")))
     log.append("  [CREATE] %s -> %s  (%s -> %s)" % (node_type, new_type, src_node, new_node))
     cache[src_node] = new_node
 
@@ -1175,10 +1690,8 @@ def convert_and_wire(source_plug, target_plug, target_renderer, cache, log,
     # Recreate incoming connections: recurse for each input
     input_map = conversion.get("inputs", {})
     for old_in_attr, new_in_attr in input_map.items():
-        if not cmds.attributeQuery(old_in_attr, node=src_node, exists=True):
-            continue
-        upstream_plugs = cmds.listConnections(
-            "%s.%s" % (src_node, old_in_attr), **_lc_kwargs()) or []
+        # missing attributes simply report no connections
+        upstream_plugs = get_upstream_plugs(src_node, old_in_attr)
         for up_plug in upstream_plugs:
             convert_and_wire(up_plug, "%s.%s" % (new_node, new_in_attr),
                             target_renderer, cache, log)
@@ -1211,17 +1724,17 @@ def ensure_bump_chain(source_plug, dst_shader, dst_bump_attr, target_renderer, c
     if not default_bump:
         return False
     bump_type, canonical_out, bump_input_attr = default_bump
-    if bump_type not in (cmds.allNodeTypes() or []):
+    if bump_type not in get_all_node_types():
         log.append("  [BUMP-WARN] '%s' not available." % bump_type)
         return False
-    bump_node = cmds.shadingNode(bump_type, asUtility=True,
-                                 name="%s_NF_bump" % dst_shader)
+    bump_node = mark_live(cmds.shadingNode(bump_type, asUtility=True,
+                                           name="%s_NF_bump" % dst_shader))
     log.append("  [BUMP] Created %s: %s" % (bump_type, bump_node))
 
     # Coerce source plug when it comes from a file: normal => outColor, height => outAlpha
     wire_plug = source_plug
-    src_node = source_plug.split(".")[0] if source_plug else ""
-    if src_node and cmds.objExists(src_node) and cmds.nodeType(src_node) == "file":
+    src_node = source_plug.partition(".")[0] if source_plug else ""
+    if src_node and node_exists(src_node) and get_node_type(src_node) == "file":
         is_normal = False
         if force_mode == "normal":
             is_normal = True
@@ -1257,7 +1770,8 @@ def ensure_bump_chain(source_plug, dst_shader, dst_bump_attr, target_renderer, c
 def build_converted_node(src_node, target_renderer, converted_cache, log):
     """
     Create the equivalent node for target_renderer if needed.
-    Recursively rebuild the FULL upstream chain.
+    Rebuilds the FULL upstream chain iteratively: the graph is first walked
+    with an explicit stack, then nodes are created upstream-first and wired.
     Returns the NEW node name (or the original if no conversion needed).
     Bump-chain fix: NODE_CONVERSION_TABLE now includes canonical_output for bump
     nodes; do_transfer/resolve_output_plug use it so the shader always gets
@@ -1266,87 +1780,84 @@ def build_converted_node(src_node, target_renderer, converted_cache, log):
     if src_node in converted_cache:
         return converted_cache[src_node]
 
-    node_type = cmds.nodeType(src_node)
-
-    # Passthrough — keep as-is, still recurse upstream to convert any
-    # deeper nodes that feed into this one
-    if node_type in PASSTHROUGH_NODES:
-        converted_cache[src_node] = src_node
-        # Still recurse so deeper nodes get converted
-        for up in (cmds.listConnections(
-                src_node, source=True, destination=False) or []):
-            build_converted_node(up, target_renderer, converted_cache, log)
-        return src_node
-
-    conversion = NODE_CONVERSION_TABLE.get(node_type, {}).get(target_renderer)
-
-    if not conversion:
-        # No conversion rule — keep and recurse
-        converted_cache[src_node] = src_node
-        for up in (cmds.listConnections(
-                src_node, source=True, destination=False) or []):
-            build_converted_node(up, target_renderer, converted_cache, log)
-        return src_node
-
-    new_type = conversion["type"]
-
-    # If same type (no change needed) keep it
-    if new_type == node_type:
-        converted_cache[src_node] = src_node
-        for up in (cmds.listConnections(
-                src_node, source=True, destination=False) or []):
-            build_converted_node(up, target_renderer, converted_cache, log)
-        return src_node
-
-    if new_type not in (cmds.allNodeTypes() or []):
-        log.append(f"  [WARN] Node type '{new_type}' not in Maya — keeping '{node_type}'")
-        converted_cache[src_node] = src_node
-        return src_node
-
-    # Create the new node
-    new_node = cmds.shadingNode(new_type, asUtility=True,
-                                 name=src_node + "_RSconv")
-    log.append(f"  [CREATE] {node_type} → {new_type}  ({src_node} → {new_node})")
-    converted_cache[src_node] = new_node
-
-    # Apply post-set attributes
-    for attr, val in conversion.get("post_set", {}).items():
-        try:
-            cmds.setAttr(f"{new_node}.{attr}", val)
-            log.append(f"  [SET]    {new_node}.{attr} = {val}")
-        except Exception as e:
-            log.append(f"  [WARN]   setAttr {new_node}.{attr}: {e}")
-
-    # Rebuild upstream connections INTO the new node
-    input_map = conversion.get("inputs", {})
-    for old_src_attr, new_dst_attr in input_map.items():
-        if not cmds.attributeQuery(old_src_attr, node=src_node, exists=True):
+    # ── Pass 1: walk upstream, plan each node, record post-order ──
+    # plan = (node_type, conversion, [(upstream_plug, new_input_attr), ...])
+    # conversion is None when the node is kept as-is.
+    plans = {}
+    order = []
+    stack = [(src_node, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
             continue
-        upstream_plugs = cmds.listConnections(
-            f"{src_node}.{old_src_attr}", **_lc_kwargs()
-        ) or []
-        for up_plug in upstream_plugs:
-            up_node = up_plug.split(".")[0]
-            up_attr = up_plug.split(".", 1)[1]
+        if node in converted_cache or node in plans:
+            continue
+        node_type = get_node_type(node)
+        conversion = None
+        if node_type not in PASSTHROUGH_NODES:
+            conversion = CONVERSION_BY_TYPE_RENDERER.get((node_type, target_renderer))
+        if conversion and conversion["type"] == node_type:
+            conversion = None
+
+        wires = []
+        if conversion is None:
+            # Passthrough / no rule / same type — keep, but still convert
+            # any deeper nodes that feed into this one
+            upstream = get_upstream_nodes(node)
+        elif conversion["type"] not in get_all_node_types():
+            log.append(f"  [WARN] Node type '{conversion['type']}' not in Maya — keeping '{node_type}'")
+            conversion = None
+            upstream = []
+        else:
+            for old_src_attr, new_dst_attr in conversion.get("inputs", {}).items():
+                for up_plug in get_upstream_plugs(node, old_src_attr):
+                    wires.append((up_plug, new_dst_attr))
+            upstream = [up_plug.partition(".")[0] for up_plug, _ in wires]
+
+        plans[node] = (node_type, conversion, wires)
+        stack.append((node, True))
+        stack.extend((up, False) for up in reversed(upstream))
+
+    # ── Pass 2: create converted nodes, upstream first ──
+    for node in order:
+        node_type, conversion, wires = plans[node]
+        if conversion is None:
+            converted_cache[node] = node
+            continue
+        new_type = conversion["type"]
+        new_node = mark_live(sys.intern(cmds.shadingNode(new_type, asUtility=True,
+                                                         name=node + "_RSconv")))
+        log.append(f"  [CREATE] {node_type} → {new_type}  ({node} → {new_node})")
+        converted_cache[node] = new_node
+
+        # Apply post-set attributes
+        for attr, val in conversion.get("post_set", {}).items():
+            try:
+                cmds.setAttr(f"{new_node}.{attr}", val)
+                log.append(f"  [SET]    {new_node}.{attr} = {val}")
+            except Exception as e:
+                log.append(f"  [WARN]   setAttr {new_node}.{attr}: {e}")
 
-            # Recurse — convert the upstream node too if needed
-            converted_up = build_converted_node(
-                up_node, target_renderer, converted_cache, log
-            )
+    # ── Pass 3: rebuild upstream connections INTO the new nodes ──
+    for node in order:
+        node_type, conversion, wires = plans[node]
+        new_node = converted_cache[node]
+        for up_plug, new_dst_attr in wires:
+            up_node, _, up_attr = up_plug.partition(".")
+            converted_up = converted_cache.get(up_node, up_node)
 
             # Remap the output attribute if the upstream node was converted
             if converted_up != up_node:
-                up_conversion = NODE_CONVERSION_TABLE.get(
-                    cmds.nodeType(up_node), {}
-                ).get(target_renderer, {})
+                up_conversion = CONVERSION_BY_TYPE_RENDERER.get(
+                    (get_node_type(up_node), target_renderer), {})
                 out_map = up_conversion.get("outputs", {})
                 up_attr = out_map.get(up_attr, up_attr)
 
-            src_plug = f"{converted_up}.{up_attr}"
-            dst_plug = f"{new_node}.{new_dst_attr}"
-            _safe_connect(src_plug, dst_plug, log)
+            _safe_connect(f"{converted_up}.{up_attr}",
+                          f"{new_node}.{new_dst_attr}", log)
 
-    return new_node
+    return converted_cache[src_node]
 
 
 def resolve_output_plug(source_plug, target_renderer, converted_cache, log,
@@ -1358,9 +1869,9 @@ def resolve_output_plug(source_plug, target_renderer, converted_cache, log,
     so the shader's bump/normal input is always driven by the bump node's
     proper output (e.g. RedshiftBumpMap.out, bump2d.outNormal).
     """
-    src_node = source_plug.split(".")[0]
-    src_attr = source_plug.split(".", 1)[1]
-    node_type = cmds.nodeType(src_node)
+    src_node = source_plug.partition(".")[0]
+    src_attr = source_plug.partition(".")[2]
+    node_type = get_node_type(src_node)
 
     # Build/get the converted node
     converted = build_converted_node(src_node, target_renderer, converted_cache, log)
@@ -1373,12 +1884,12 @@ def resolve_output_plug(source_plug, target_renderer, converted_cache, log,
         return source_plug
 
     # Remap the output attribute
-    conversion = NODE_CONVERSION_TABLE.get(node_type, {}).get(target_renderer, {})
+    conversion = CONVERSION_BY_TYPE_RENDERER.get((node_type, target_renderer), {})
     out_map = conversion.get("outputs", {})
     new_attr = out_map.get(src_attr, src_attr)
     # For bump slots, always use the canonical output of the converted node
     # so the shader is driven by the bump node's correct plug.
-    converted_type = cmds.nodeType(converted)
+    converted_type = get_node_type(converted)
     if target_is_bump_slot and converted_type in BUMP_NODE_TYPES:
         new_attr = CANONICAL_OUTPUT_BY_BUMP_TYPE.get(converted_type, new_attr)
     return f"{converted}.{new_attr}"
@@ -1395,27 +1906,28 @@ def create_bump_node_for_file(entry, target_renderer, converted_cache, log):
     if not default_bump:
         return None
     bump_type, canonical_out, input_attr = default_bump
-    if bump_type not in (cmds.allNodeTypes() or []):
+    if bump_type not in get_all_node_types():
         log.append("  [BUMP] [WARN] Bump type '%s' not available in Maya." % bump_type)
         return None
 
-    source_node = entry["source_node"]
-    source_plug = entry["source_plug"]
-    src_attr = source_plug.split(".", 1)[1] if source_plug else "outColor"
+    source_node = entry.source_node
+    source_plug = entry.source_plug
+    src_attr = source_plug.partition(".")[2] if source_plug else "outColor"
 
     # Convert upstream (file stays as file; any color correctors etc. get converted)
     converted_src = build_converted_node(source_node, target_renderer, converted_cache, log)
     # Use same attribute on converted source (e.g. outColor or outAlpha)
     if converted_src != source_node:
-        node_type = cmds.nodeType(source_node)
-        conv = NODE_CONVERSION_TABLE.get(node_type, {}).get(target_renderer, {})
+        node_type = get_node_type(source_node)
+        conv = CONVERSION_BY_TYPE_RENDERER.get((node_type, target_renderer), {})
         out_map = conv.get("outputs", {})
         src_attr = out_map.get(src_attr, src_attr)
     src_plug = "%s.%s" % (converted_src, src_attr)
 
     # Create bump node
-    new_bump = cmds.shadingNode(bump_type, asUtility=True,
-                                name=source_node + "_bump_%s" % target_renderer[:2])
+    new_bump = mark_live(cmds.shadingNode(
+        bump_type, asUtility=True,
+        name=source_node + "_bump_%s" % target_renderer[:2]))
     log.append("  [BUMP] Created %s %s for shader (file → bump chain)" % (bump_type, new_bump))
 
     # Redshift: set inputType 0=height (outAlpha), 1=tangent normal (outColor)
@@ -1437,36 +1949,84 @@ def create_bump_node_for_file(entry, target_renderer, converted_cache, log):
 #  DATA COLLECTION
 # ══════════════════════════════════════════════════════════════════════
 
+# Transfer modes and the displacement pseudo-slot. Literals like these are
+# interned by the compiler, so every entry shares one string object and
+# == short-circuits on identity; keep them as named constants, not copies.
+MODE_TEXTURE = "texture"
+MODE_VALUE   = "value"
+DISPLACEMENT_SLOT = "_displacement_"
+
+# getAttr result shape -> setter; the shape is tagged once at scan time
+VALUE_SETTERS = {
+    "double3_tuple": lambda plug, v: cmds.setAttr(plug, *v[0], type="double3"),
+    "double3_list":  lambda plug, v: cmds.setAttr(plug, *v, type="double3"),
+    "scalar":        lambda plug, v: cmds.setAttr(plug, v),
+}
+
+
+def get_value_kind(val):
+    """Return the VALUE_SETTERS key for a getAttr result."""
+    if isinstance(val, list):
+        return "double3_tuple" if val and isinstance(val[0], tuple) \
+               else "double3_list"
+    return "scalar"
+
+
+class TransferEntry(object):
+    """One shader attribute to transfer (texture connection or raw value)."""
+    __slots__ = (
+        "shader", "shader_attr", "source_plug", "source_node",
+        "file_node", "file_path", "tgt_attr", "preferred_plug",
+        "target_type", "transfer_mode", "raw_value", "value_kind",
+    )
+
+    def __init__(self, shader, shader_attr, source_plug, source_node,
+                 file_node, file_path, tgt_attr, preferred_plug,
+                 target_type, transfer_mode, raw_value, value_kind=None):
+        self.shader         = shader
+        self.shader_attr    = shader_attr
+        self.source_plug    = source_plug
+        self.source_node    = source_node
+        self.file_node      = file_node
+        self.file_path      = file_path
+        self.tgt_attr       = tgt_attr
+        self.preferred_plug = preferred_plug
+        self.target_type    = target_type
+        self.transfer_mode  = transfer_mode
+        self.raw_value      = raw_value
+        self.value_kind     = value_kind
+
+
+@traversal_cache()
 def collect_data(shader, target_mat_type):
     results = []
-    for src_attr, target_map in MASTER_MAP.items():
-        if target_mat_type not in target_map:
-            continue
-        if not cmds.attributeQuery(src_attr, node=shader, exists=True):
+    prime_upstream_graph(shader)
+    attr_map = MASTER_MAP_BY_TARGET.get(target_mat_type, {})
+    prime_attrs(shader, attr_map)
+    for src_attr, (tgt_attr, preferred_plug) in attr_map.items():
+        if not has_attr(shader, src_attr):
             continue
 
-        tgt_attr, preferred_plug = target_map[target_mat_type]
         source_plug = get_exact_source_plug(shader, src_attr)
 
         if source_plug:
-            source_node = source_plug.split(".")[0]
-            file_nodes  = walk_upstream_for_file(source_node)
-            file_node   = file_nodes[0] if file_nodes else None
-            file_path   = (cmds.getAttr(file_node + ".fileTextureName") or "") \
+            source_node = source_plug.partition(".")[0]
+            file_node   = walk_upstream_for_file(source_node)
+            file_path   = get_string_attr(file_node, "fileTextureName") \
                           if file_node else ""
-            results.append({
-                "shader":         shader,
-                "shader_attr":    src_attr,
-                "source_plug":    source_plug,
-                "source_node":    source_node,
-                "file_node":      file_node,
-                "file_path":      file_path,
-                "tgt_attr":       tgt_attr,
-                "preferred_plug": preferred_plug,
-                "target_type":    target_mat_type,
-                "transfer_mode":  "texture",
-                "raw_value":      None,
-            })
+            results.append(TransferEntry(
+                shader=shader,
+                shader_attr=src_attr,
+                source_plug=source_plug,
+                source_node=source_node,
+                file_node=file_node,
+                file_path=file_path,
+                tgt_attr=tgt_attr,
+                preferred_plug=preferred_plug,
+                target_type=target_mat_type,
+                transfer_mode=MODE_TEXTURE,
+                raw_value=None,
+            ))
         else:
             if src_attr not in VALUE_MAP:
                 continue
@@ -1475,69 +2035,177 @@ def collect_data(shader, target_mat_type):
             except Exception:
                 continue
             # Skip boring defaults
-            if isinstance(val, list) and isinstance(val[0], tuple):
-                flat = list(val[0])
-                if flat == [0.0, 0.0, 0.0] and src_attr not in (
-                    "baseColor", "color", "specularColor"
-                ):
-                    continue
-            elif isinstance(val, float) and val == 0.0 and src_attr in (
-                "emission", "subsurface", "coat"
-            ):
+            if SKIP_DEFAULT_VALUE[src_attr](val):
                 continue
 
-            results.append({
-                "shader":         shader,
-                "shader_attr":    src_attr,
-                "source_plug":    None,
-                "source_node":    None,
-                "file_node":      None,
-                "file_path":      "",
-                "tgt_attr":       tgt_attr,
-                "preferred_plug": preferred_plug,
-                "target_type":    target_mat_type,
-                "transfer_mode":  "value",
-                "raw_value":      val,
-            })
+            results.append(TransferEntry(
+                shader=shader,
+                shader_attr=src_attr,
+                source_plug=None,
+                source_node=None,
+                file_node=None,
+                file_path="",
+                tgt_attr=tgt_attr,
+                preferred_plug=preferred_plug,
+                target_type=target_mat_type,
+                transfer_mode=MODE_VALUE,
+                raw_value=val,
+                value_kind=get_value_kind(val),
+            ))
 
     return results
 
 
+_collected = {}             # shader -> {target_mat_type: tuple of entries}
+_collected_watch = {}       # node -> (MObjectHandle, callback ids)
+_collected_users = defaultdict(set)  # node -> shaders whose cached scan read it
+_collected_callbacks = []   # cache is only trusted while these are live
+
+
+def get_collected_data(shader, target_mat_type):
+    """collect_data() memoized until the shader or a node upstream of it is
+    edited, rewired, renamed or deleted."""
+    by_target = _collected.get(shader) if _collected_callbacks else None
+    if by_target is not None and target_mat_type in by_target:
+        return list(by_target[target_mat_type])
+    data = collect_data(shader, target_mat_type)
+    if _collected_callbacks and all(
+            _watch_collected(node, shader) for node in _upstream_closure(shader)):
+        _collected.setdefault(shader, {})[target_mat_type] = tuple(data)
+    return data
+
+
+def _upstream_closure(node):
+    # answered from the graph collect_data just primed when inside a scan
+    seen = {node}
+    stack = [node]
+    while stack:
+        for up in get_upstream_nodes(stack.pop()):
+            if up not in seen:
+                seen.add(up)
+                stack.append(up)
+    return seen
+
+
+def _watch_collected(node, shader):
+    obj = get_mobject(node)
+    if obj is None:
+        return False
+    watched = _collected_watch.get(node)
+    if watched is not None:
+        handle, ids = watched
+        if not (handle.isValid() and handle.object() == obj):
+            remove_callbacks(ids)   # the name now belongs to another node
+            del _collected_watch[node]
+            _collected_users.pop(node, None)
+            watched = None
+    if watched is None:
+        ids = []
+        try:
+            ids.append(om2.MNodeMessage.addAttributeChangedCallback(
+                obj, _on_collected_attr_changed, node))
+            ids.append(om2.MNodeMessage.addNameChangedCallback(
+                obj, forget_collected, node))
+            ids.append(om2.MNodeMessage.addNodePreRemovalCallback(
+                obj, forget_collected, node))
+        except Exception:
+            remove_callbacks(ids)
+            return False
+        _collected_watch[node] = (om2.MObjectHandle(obj), ids)
+    _collected_users[node].add(shader)
+    return True
+
+
+def _on_collected_attr_changed(msg, plug, other_plug, node):
+    # values set, attributes added/removed and connections INTO the node can
+    # change a scan; outgoing ones (the transfer wiring a file to the new
+    # shader) and evaluation leave the upstream network as it was
+    msgs = om2.MNodeMessage
+    if msg & (msgs.kAttributeSet | msgs.kAttributeAdded | msgs.kAttributeRemoved) or \
+            (msg & (msgs.kConnectionMade | msgs.kConnectionBroken) and
+             msg & msgs.kIncomingDirection):
+        forget_collected(node)
+
+
+def forget_collected(*args):
+    # client data (the watched node name) is always the last argument
+    for shader in _collected_users.get(args[-1], ()):
+        _collected.pop(shader, None)
+
+
+def reset_collected_cache(*args):
+    _collected.clear()
+
+
+def add_collected_callbacks():
+    """Drop every memoized scan when a scene is opened or created; edits are
+    caught per node by _watch_collected. Returns the callback ids so the
+    owning window can remove them."""
+    if not HAS_OM2 or _collected_callbacks:
+        return []
+    ids = []
+    try:
+        for event in ("SceneOpened", "NewSceneOpened"):
+            ids.append(om2.MEventMessage.addEventCallback(
+                event, reset_collected_cache))
+    except Exception:
+        remove_callbacks(ids)
+        return []
+    reset_collected_cache()
+    _collected_callbacks.extend(ids)
+    return ids
+
+
+def remove_collected_callbacks(ids):
+    remove_callbacks(ids)
+    del _collected_callbacks[:]
+    for _, watch_ids in _collected_watch.values():
+        remove_callbacks(watch_ids)
+    _collected_watch.clear()
+    _collected_users.clear()
+    reset_collected_cache()
+
+
 def validate_transfer(data, target_node, target_mat_type):
     warnings = []
     slot_seen = {}
     target_renderer = get_renderer_from_mat_type(target_mat_type)
+    check_attrs = target_mat_type != "MASH" and bool(target_node)
+    target_attrs = set(cmds.listAttr(target_node) or ()) if check_attrs else set()
+    source_types = get_node_types({e.source_node for e in data if e.source_node})
     for entry in data:
-        tgt_attr = entry["tgt_attr"]
-        if entry["file_node"] and not entry["file_path"]:
+        tgt_attr = entry.tgt_attr
+        if entry.file_node and not entry.file_path:
             warnings.append({"level": "warn", "message":
-                f"File node '{entry['file_node']}' on '{entry['shader_attr']}' "
+                f"File node '{entry.file_node}' on '{entry.shader_attr}' "
                 f"has NO texture path.\n  ➤ Assign an image in Hypershade first.",
                 "entry": entry})
-        if tgt_attr in slot_seen:
+        prev = slot_seen.get(tgt_attr)
+        if prev is not None:
             warnings.append({"level": "warn", "message":
-                f"Conflict: '{slot_seen[tgt_attr]['shader_attr']}' and "
-                f"'{entry['shader_attr']}' both target '{tgt_attr}'.\n"
+                f"Conflict: '{prev.shader_attr}' and "
+                f"'{entry.shader_attr}' both target '{tgt_attr}'.\n"
                 f"  ➤ Last connection wins.", "entry": entry})
         slot_seen[tgt_attr] = entry
-        if target_mat_type not in ("MASH",) and target_node and \
-                not tgt_attr.startswith("_displacement_") and \
+        if check_attrs and \
+                not tgt_attr.startswith(DISPLACEMENT_SLOT) and \
                 not tgt_attr.startswith("MASH_"):
-            base = tgt_attr.split(".")[0]
-            if not cmds.attributeQuery(base, node=target_node, exists=True):
+            base = tgt_attr.partition(".")[0]
+            # listAttr only reports long names; confirm misses individually
+            if base not in target_attrs and \
+                    not cmds.attributeQuery(base, node=target_node, exists=True):
                 warnings.append({"level": "error", "message":
                     f"Attribute '{tgt_attr}' not found on '{target_node}'.\n"
                     f"  ➤ Make sure renderer plugin is loaded.",
                     "entry": entry})
-        if entry["source_node"]:
-            nt = cmds.nodeType(entry["source_node"])
-            if nt in NODE_CONVERSION_TABLE:
-                conv = NODE_CONVERSION_TABLE[nt].get(target_renderer)
-                if conv and conv["type"] != nt:
-                    warnings.append({"level": "warn", "message":
-                        f"'{entry['source_node']}' ({nt}) → "
-                        f"AUTO-CONVERT to '{conv['type']}' for {target_renderer}.\n"
-                        f"  ➤ NodeFlow handles this.", "entry": entry})
+        if entry.source_node:
+            nt = source_types.get(entry.source_node)
+            conv = CONVERSION_BY_TYPE_RENDERER.get((nt, target_renderer))
+            if conv and conv["type"] != nt:
+                warnings.append({"level": "warn", "message":
+                    f"'{entry.source_node}' ({nt}) → "
+                    f"AUTO-CONVERT to '{conv['type']}' for {target_renderer}.\n"
+                    f"  ➤ NodeFlow handles this.", "entry": entry})
     return warnings
 
 
@@ -1545,77 +2213,133 @@ def validate_transfer(data, target_node, target_mat_type):
 #  DO TRANSFER  ← FIXED: bump slot always wired from bump node canonical output
 # ══════════════════════════════════════════════════════════════════════
 
-def do_transfer(data, target_node, target_mat_type, mash_waiter=None):
+def resolve_destination_plugs(data, target_node, target_mat_type, mash_waiter, log):
+    """
+    Return [(entry, dst_plug), ...] for the entries that have a destination.
+    Entries are grouped by destination kind (MASH_Color, MASH_Distribute,
+    displacement, plain shader attribute) so each kind's node is resolved
+    once; order within a kind is kept, so "last connection wins" still holds.
+    """
+    jobs = []
+    if target_mat_type == "MASH":
+        if not mash_waiter or not node_exists(mash_waiter):
+            log.extend("[ERROR] MASH Waiter not found." for _ in data)
+            return jobs
+        color_entries = []
+        dist_entries  = []
+        for entry in data:
+            if entry.tgt_attr.startswith("MASH_Color."):
+                color_entries.append(entry)
+            elif entry.tgt_attr.startswith("MASH_Distribute."):
+                dist_entries.append(entry)
+
+        if color_entries:
+            ex = cmds.listConnections(mash_waiter, type="MASH_Color") or []
+            color_node = ex[0] if ex else cmds.createNode(
+                "MASH_Color", name=mash_waiter + "_Color"
+            )
+            if not ex:
+                cmds.setAttr(color_node + ".mapType", 1)
+                log.append(f"[INFO] Created MASH_Color: {color_node}")
+            color_prefix = color_node + "."
+            for entry in color_entries:
+                _, _, mash_attr = entry.tgt_attr.partition(".")
+                jobs.append((entry, color_prefix + mash_attr))
+
+        if dist_entries:
+            dist = cmds.listConnections(mash_waiter, type="MASH_Distribute") or []
+            if not dist:
+                for entry in dist_entries:
+                    log.append(f"[SKIP] No MASH_Distribute for '{entry.shader_attr}'.")
+            else:
+                cmds.setAttr(dist[0] + ".useStrengthMap", 1)
+                dist_prefix = dist[0] + "."
+                for entry in dist_entries:
+                    _, _, mash_attr = entry.tgt_attr.partition(".")
+                    jobs.append((entry, dist_prefix + mash_attr))
+        return jobs
+
+    disp_entries  = []
+    plain_entries = []
+    for entry in data:
+        if entry.tgt_attr == DISPLACEMENT_SLOT:
+            disp_entries.append(entry)
+        else:
+            plain_entries.append(entry)
+
+    if disp_entries:
+        sgs = (cmds.listConnections(target_node, type="shadingEngine") or []) \
+              if target_node else []
+        if not sgs:
+            log.extend("[SKIP] No shadingGroup for displacement."
+                       for _ in disp_entries)
+        else:
+            disp_plug = sgs[0] + ".displacementShader"
+            jobs.extend((entry, disp_plug) for entry in disp_entries)
+
+    if plain_entries:
+        if not target_node or not node_exists(target_node):
+            log.extend(f"[ERROR] Target '{target_node}' not found."
+                       for _ in plain_entries)
+        else:
+            tgt_prefix = target_node + "."
+            jobs.extend((entry, tgt_prefix + entry.tgt_attr)
+                        for entry in plain_entries)
+    return jobs
+
+
+@traversal_cache()
+def do_transfer(data, target_node, target_mat_type, mash_waiter=None,
+                converted_cache=None):
     """
     Bump-chain fix: For normalCamera / bump_input slots we always connect the
     canonical output of a bump node to the shader. If source is a file we
     create a bump node and wire file→bump→shader; otherwise we convert the
     existing bump node and wire its canonical output (e.g. .out, .outNormal).
+    Pass the same converted_cache for every shader of one batch (same target
+    type) so shared upstream nodes are converted only once.
     """
     log = []
-    color_node = None
-    converted_cache = {}   # shared per-shader transfer
+    if converted_cache is None:
+        converted_cache = {}   # shared per-shader transfer
     target_renderer = get_renderer_from_mat_type(target_mat_type)
-
-    for entry in data:
-        tgt_attr = entry["tgt_attr"]
-        mode     = entry["transfer_mode"]
-
-        # ── Resolve destination plug ───────────────────────────────────
-        if target_mat_type == "MASH":
-            if not mash_waiter or not cmds.objExists(mash_waiter):
-                log.append("[ERROR] MASH Waiter not found.")
-                continue
-            if tgt_attr.startswith("MASH_Color."):
-                mash_attr = tgt_attr.split(".", 1)[1]
-                if color_node is None:
-                    ex = cmds.listConnections(mash_waiter, type="MASH_Color") or []
-                    color_node = ex[0] if ex else cmds.createNode(
-                        "MASH_Color", name=mash_waiter + "_Color"
-                    )
-                    if not ex:
-                        cmds.setAttr(color_node + ".mapType", 1)
-                        log.append(f"[INFO] Created MASH_Color: {color_node}")
-                dst_plug = f"{color_node}.{mash_attr}"
-            elif tgt_attr.startswith("MASH_Distribute."):
-                mash_attr = tgt_attr.split(".", 1)[1]
-                dist = cmds.listConnections(mash_waiter, type="MASH_Distribute") or []
-                if not dist:
-                    log.append(f"[SKIP] No MASH_Distribute for '{entry['shader_attr']}'.")
-                    continue
-                cmds.setAttr(dist[0] + ".useStrengthMap", 1)
-                dst_plug = f"{dist[0]}.{mash_attr}"
-            else:
-                continue
-        elif tgt_attr == "_displacement_":
-            sgs = cmds.listConnections(target_node, type="shadingEngine") or []
-            if not sgs:
-                log.append("[SKIP] No shadingGroup for displacement.")
-                continue
-            dst_plug = f"{sgs[0]}.displacementShader"
-        else:
-            if not target_node or not cmds.objExists(target_node):
-                log.append(f"[ERROR] Target '{target_node}' not found.")
-                continue
-            dst_plug = f"{target_node}.{tgt_attr}"
+    for shader in {entry.shader for entry in data}:
+        prime_upstream_graph(shader)
+    # one ls for every node the loop checks, instead of objExists per entry
+    prime_live_nodes({target_node, mash_waiter} |
+                     {entry.source_node for entry in data})
+    if target_node and node_exists(target_node):
+        prime_connections(target_node)
+
+    # module globals bound once for the per-entry loop
+    setters    = VALUE_SETTERS
+    bump_slots = BUMP_SLOT_ATTRS
+    bump_roots = {}   # source_plug -> first upstream bump node (or None)
+    for entry, dst_plug in resolve_destination_plugs(
+            data, target_node, target_mat_type, mash_waiter, log):
+        tgt_attr = entry.tgt_attr
+        mode     = entry.transfer_mode
 
         # ── Transfer texture ───────────────────────────────────────────
-        if mode == "texture":
-            source_plug = entry["source_plug"]
+        if mode == MODE_TEXTURE:
+            source_plug = entry.source_plug
             if not source_plug:
                 log.append("[SKIP] No source plug for texture entry.")
                 continue
             is_bump = (
-                entry["shader_attr"] in BUMP_SLOT_ATTRS or
-                tgt_attr in BUMP_SLOT_ATTRS
+                entry.shader_attr in bump_slots or
+                tgt_attr in bump_slots
             )
             if is_bump:
                 dst_shader = target_node
                 dst_attr = tgt_attr  # bump_input for RS, normalCamera for Arnold/Maya
-                bump_root = find_first_bump_node_upstream(source_plug)
+                if source_plug not in bump_roots:
+                    bump_roots[source_plug] = \
+                        find_first_bump_node_upstream(source_plug)
+                bump_root = bump_roots[source_plug]
                 if bump_root:
                     bump_out_attr = CANONICAL_OUTPUT_BY_BUMP_TYPE.get(
-                        cmds.nodeType(bump_root), "outNormal"
+                        get_node_type(bump_root), "outNormal"
                     )
                     bump_out_plug = "%s.%s" % (bump_root, bump_out_attr)
                     ok = convert_and_wire(
@@ -1644,17 +2368,12 @@ def do_transfer(data, target_node, target_mat_type, mash_waiter=None):
                 log.append("[FAIL] texture %s -> %s" % (source_plug, dst_plug))
 
         # ── Transfer raw value ─────────────────────────────────────────
-        elif mode == "value":
-            val = entry["raw_value"]
+        elif mode == MODE_VALUE:
+            val = entry.raw_value
             try:
-                if isinstance(val, list) and isinstance(val[0], tuple):
-                    cmds.setAttr(dst_plug, *val[0], type="double3")
-                elif isinstance(val, list):
-                    cmds.setAttr(dst_plug, *val, type="double3")
-                else:
-                    cmds.setAttr(dst_plug, val)
+                setters[entry.value_kind](dst_plug, val)
                 log.append(
-                    f"[OK-V] {entry['shader']}.{entry['shader_attr']:<28}"
+                    f"[OK-V] {entry.shader}.{entry.shader_attr:<28}"
                     f"  →  {dst_plug}  =  {val}"
                 )
             except Exception as e:
@@ -1666,7 +2385,7 @@ def do_transfer(data, target_node, target_mat_type, mash_waiter=None):
 def create_target_shader(mat_type, base_name):
     if mat_type == "MASH":
         return None
-    if mat_type not in (cmds.allNodeTypes() or []):
+    if mat_type not in get_all_node_types():
         return None
     shader = cmds.shadingNode(mat_type, asShader=True, name=base_name + "_NF")
     sg = cmds.sets(renderable=True, noSurfaceShader=True,
@@ -1678,22 +2397,39 @@ def create_target_shader(mat_type, base_name):
     return shader
 
 
-def assign_shader_to_meshes(new_shader, old_shader, log):
-    old_sgs = cmds.listConnections(old_shader, type="shadingEngine") or []
+def assign_shader_to_meshes(new_shader, old_shader, log, index=None):
+    """Move every member of old_shader's SGs to new_shader's SG.
+    index: optional ShadingIndex shared across a batch; it must predate
+    new_shader, whose SG is always queried live."""
+    if index is not None:
+        old_sgs = index.sgs_by_node.get(old_shader, [])
+    else:
+        old_sgs = cmds.listConnections(old_shader, type="shadingEngine") or []
     new_sgs = cmds.listConnections(new_shader, type="shadingEngine") or []
     new_sg  = new_sgs[0] if new_sgs else None
     if not new_sg:
         log.append(f"[SKIP] No SG on new shader '{new_shader}'.")
         return 0
-    total = 0
+    moved = []   # (old_sg, members), reassigned with one sets call
     for old_sg in old_sgs:
-        members = cmds.sets(old_sg, q=True) or []
+        if index is not None:
+            members = index.members(old_sg)
+        else:
+            members = cmds.sets(old_sg, q=True) or []
         if members:
-            cmds.sets(members, e=True, forceElement=new_sg)
-            total += len(members)
-            log.append(
-                f"[ASSIGN] {len(members)} object(s): {old_sg} → {new_sg}"
-            )
+            moved.append((old_sg, members))
+    if not moved:
+        return 0
+    cmds.sets([m for _, members in moved for m in members],
+              e=True, forceElement=new_sg)
+    total = 0
+    for old_sg, members in moved:
+        if index is not None:
+            index.forget_members(old_sg)
+        total += len(members)
+        log.append(
+            f"[ASSIGN] {len(members)} object(s): {old_sg} → {new_sg}"
+        )
     return total
 
 
@@ -1767,17 +2503,17 @@ QListWidget {
 QListWidget::item           { padding: 4px 8px; }
 QListWidget::item:selected  { background-color: #1b3a6b; color: #fff; }
 QListWidget::item:hover     { background-color: #162d50; }
-QTableWidget {
+QTableView {
     background-color: #0a1628; gridline-color: #1e3a5f;
     border: 1px solid #1e3a5f; border-radius: 4px;
 }
-QTableWidget::item          { padding: 3px 6px; }
-QTableWidget::item:selected { background-color: #1b3a6b; color: #fff; }
+QTableView::item            { padding: 3px 6px; }
+QTableView::item:selected   { background-color: #1b3a6b; color: #fff; }
 QHeaderView::section {
     background-color: #112240; color: #7aa2c8;
     border: 1px solid #1e3a5f; padding: 5px 6px; font-weight: bold;
 }
-QTextEdit {
+QTextEdit, QPlainTextEdit {
     background-color: #0a1628; border: 1px solid #1e3a5f;
     border-radius: 4px; color: #cdd9e5;
     font-family: 'Consolas', monospace; font-size: 12px;
@@ -1804,6 +2540,9 @@ QFrame#divider { color: #1e3a5f; }
 # ══════════════════════════════════════════════════════════════════════
 
 class DragDropLineEdit(QtWidgets.QLineEdit):
+    # last "|"-separated segment of every line of a Maya mime payload
+    _LAST_SEG = re.compile(r"([^|\r\n]+)\r?$", re.M)
+
     def __init__(self, placeholder="", parent=None):
         super().__init__(parent)
         self.setPlaceholderText(placeholder)
@@ -1839,12 +2578,19 @@ class DragDropLineEdit(QtWidgets.QLineEdit):
             event.acceptProposedAction()
 
     def _parse_maya_mime(self, raw):
+        names = [m.strip() for m in self._LAST_SEG.findall(raw)]
+        names = [n for n in names if n]
+        if names:
+            # one ls for the whole drop instead of objExists per line
+            existing = set(cmds.ls(names) or [])
+            for name in names:
+                if name in existing:
+                    return name
+            # ls reports ambiguous short names as paths; check those singly
+            for name in names:
+                if cmds.objExists(name):
+                    return name
         lines = [l.strip() for l in raw.splitlines() if l.strip()]
-        for line in lines:
-            if "|" in line:
-                line = line.split("|")[-1]
-            if cmds.objExists(line):
-                return line
         return lines[0] if lines else None
 
 
@@ -1857,7 +2603,9 @@ class WarningDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.setWindowTitle("⚠️  NodeFlow — Warnings")
         self.setMinimumSize(680, 400)
-        self.setStyleSheet(STYLE)
+        # a NodeFlowTool parent already cascades STYLE; parse it only when alone
+        if parent is None:
+            self.setStyleSheet(STYLE)
         self.result_choice = False
         L = QtWidgets.QVBoxLayout(self)
         L.setSpacing(10)
@@ -1888,6 +2636,111 @@ class WarningDialog(QtWidgets.QDialog):
     def _no(self):  self.result_choice = False; self.reject()
 
 
+# ══════════════════════════════════════════════════════════════════════
+#  TRANSFER TABLE MODEL
+# ══════════════════════════════════════════════════════════════════════
+
+# foreground colours, built once instead of per cell
+_TEXTURE_COLORS = {
+    0: QtGui.QColor("#4080d0"),
+    1: QtGui.QColor("#7aa2c8"),
+    2: QtGui.QColor("#88cc88"),
+    5: QtGui.QColor("#88cc88"),
+}
+_VALUE_COLORS = dict(_TEXTURE_COLORS)
+_VALUE_COLORS[2] = QtGui.QColor("#ccaa44")
+# status kinds index both tables below
+STATUS_OK, STATUS_CONVERT, STATUS_WARN = range(3)
+_STATUS_TEXTS  = ("✓", "🔄 Will convert", "⚠ No path")
+_STATUS_COLORS = (
+    QtGui.QColor("#448844"),
+    QtGui.QColor("#4488ff"),
+    QtGui.QColor("#e08040"),
+)
+_STATUS_COLUMN = 6
+
+
+class TransferModel(QtCore.QAbstractTableModel):
+    """Serves TransferEntry rows to the review table; cells are formatted
+    on first request instead of allocating an item per cell up front."""
+    HEADERS = (
+        "Source Shader", "Attr", "Mode",
+        "Source / Value", "File Node", "→ Target Attr", "Status"
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._source_types = {}
+        self._cells = {}   # row -> (texts, column colors, status color)
+
+    def set_entries(self, entries):
+        self.beginResetModel()
+        self._rows = entries   # shared with the dialog; replaced, never mutated
+        self._source_types = get_node_types(
+            {e.source_node for e in self._rows if e.source_node}
+        )
+        self._cells = {}
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._row_cells(index.row())[0][index.column()]
+        if role == Qt.ForegroundRole:
+            _, colors, status_color = self._row_cells(index.row())
+            col = index.column()
+            return status_color if col == _STATUS_COLUMN else colors.get(col)
+        return None
+
+    def _row_cells(self, row):
+        cells = self._cells.get(row)
+        if cells is None:
+            cells = self._cells[row] = self._format_row(self._rows[row])
+        return cells
+
+    def _format_row(self, entry):
+        mode = entry.transfer_mode
+        mode_label = "🔗 Texture" if mode == MODE_TEXTURE else "🔢 Value"
+        if mode == MODE_TEXTURE:
+            src_val = entry.source_plug or "—"
+        else:
+            v = entry.raw_value
+            src_val = str(v[0]) if entry.value_kind == "double3_tuple" \
+                      else str(v)
+        status = STATUS_OK
+        if mode == MODE_TEXTURE:
+            if entry.file_node and not entry.file_path:
+                status = STATUS_WARN
+            elif entry.source_node and \
+                    self._source_types.get(entry.source_node) in NODE_CONVERSION_TABLE:
+                status = STATUS_CONVERT
+
+        texts = tuple(str(val) for val in (
+            entry.shader,
+            entry.shader_attr,
+            mode_label,
+            src_val,
+            entry.file_node or ("—" if mode == MODE_TEXTURE else "n/a"),
+            entry.tgt_attr,
+            _STATUS_TEXTS[status],
+        ))
+        colors = _TEXTURE_COLORS if mode == MODE_TEXTURE else _VALUE_COLORS
+        return texts, colors, _STATUS_COLORS[status]
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  MAIN WINDOW
 # ══════════════════════════════════════════════════════════════════════
@@ -1901,8 +2754,25 @@ class NodeFlowTool(QtWidgets.QDialog):
         self.setMinimumSize(960, 760)
         self.setStyleSheet(STYLE)
         self._all_data = []
+        self._data_by_shader = {}   # scan results grouped for _transfer
+        reset_node_type_cache()
+        self._callback_ids = add_plugin_callbacks()
+        self._shader_callback_ids = add_scene_shader_callbacks()
+        self._selection_callback_ids = add_selection_callbacks()
+        self._collected_callback_ids = add_collected_callbacks()
         self._build_ui()
 
+    def closeEvent(self, event):
+        remove_callbacks(self._callback_ids)
+        self._callback_ids = []
+        remove_scene_shader_callbacks(self._shader_callback_ids)
+        self._shader_callback_ids = []
+        remove_selection_callbacks(self._selection_callback_ids)
+        self._selection_callback_ids = []
+        remove_collected_callbacks(self._collected_callback_ids)
+        self._collected_callback_ids = []
+        super().closeEvent(event)
+
     def _build_ui(self):
         root = QtWidgets.QVBoxLayout(self)
         root.setContentsMargins(16, 12, 16, 12)
@@ -2087,20 +2957,20 @@ class NodeFlowTool(QtWidgets.QDialog):
 
         # Table
         self._sec(L, "Detected Connections & Values  —  Review before Transfer")
-        self.table = QtWidgets.QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels([
-            "Source Shader", "Attr", "Mode",
-            "Source / Value", "File Node", "→ Target Attr", "Status"
-        ])
+        self.table_model = TransferModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.table_model)
         hh = self.table.horizontalHeader()
-        hh.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        # sized once per scan in _scan; ResizeToContents would re-measure
+        # every row on each layout pass
+        hh.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
         hh.setSectionResizeMode(3, QtWidgets.QHeaderView.Stretch)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
         self.table.setStyleSheet(
-            "QTableWidget { alternate-background-color: #0e1f33; }"
+            "QTableView { alternate-background-color: #0e1f33; }"
         )
         self.table.setMinimumHeight(180)
         L.addWidget(self.table)
@@ -2124,7 +2994,7 @@ class NodeFlowTool(QtWidgets.QDialog):
         w = QtWidgets.QWidget()
         L = QtWidgets.QVBoxLayout(w)
         L.setContentsMargins(4, 4, 4, 4)
-        self.log_output = QtWidgets.QTextEdit()
+        self.log_output = QtWidgets.QPlainTextEdit()
         self.log_output.setReadOnly(True)
         clr = QtWidgets.QPushButton("🗑  Clear Log")
         clr.clicked.connect(self.log_output.clear)
@@ -2214,14 +3084,14 @@ class NodeFlowTool(QtWidgets.QDialog):
         return f
 
     def _pick(self, field):
-        sel = cmds.ls(sl=True)
+        sel = get_selection()
         if sel:
             field.setText(sel[0])
         else:
             self._log("[WARN] Nothing selected.")
 
     def _log(self, msg):
-        self.log_output.append(msg)
+        self.log_output.appendPlainText(msg)
 
     def _on_mode_changed(self):
         self.single_widget.setVisible(self.mode_single.isChecked())
@@ -2257,31 +3127,44 @@ class NodeFlowTool(QtWidgets.QDialog):
             self.shader_list.item(i).text()
             for i in range(self.shader_list.count())
         }
-        added = 0
-        for node in (cmds.ls(sl=True) or []):
-            nt = cmds.nodeType(node)
-            shader = node if nt in SUPPORTED_SOURCES else \
-                     (get_shader_from_mesh(node) or [None])[0]
+        selection = get_selection()
+        types = get_node_types(selection)
+        meshes = [n for n in selection if types.get(n) not in SUPPORTED_SOURCES]
+        # one scene-wide SG index beats per-mesh queries past a single mesh
+        index = ShadingIndex() if len(meshes) > 1 else None
+        new_items = []
+        for node in selection:
+            shader = node if types.get(node) in SUPPORTED_SOURCES else \
+                     (get_shader_from_mesh(node, index) or [None])[0]
             if shader and shader not in existing:
-                self.shader_list.addItem(shader)
+                new_items.append(shader)
                 existing.add(shader)
-                added += 1
+        self._add_list_items(new_items)
         self._update_count()
-        self._log(f"[LIST] +{added} from selection.")
+        self._log(f"[LIST] +{len(new_items)} from selection.")
 
     def _add_all_to_list(self):
         existing = {
             self.shader_list.item(i).text()
             for i in range(self.shader_list.count())
         }
-        added = 0
-        for s in get_all_scene_shaders():
-            if s not in existing:
-                self.shader_list.addItem(s)
-                existing.add(s)
-                added += 1
+        new_items = [s for s in get_all_scene_shaders() if s not in existing]
+        self._add_list_items(new_items)
         self._update_count()
-        self._log(f"[LIST] +{added} from scene.")
+        self._log(f"[LIST] +{len(new_items)} from scene.")
+
+    def _add_list_items(self, items):
+        """Append items to the shader list in one batch (single relayout)."""
+        if not items:
+            return
+        lst = self.shader_list
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            lst.addItems(items)
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
 
     def _clear_list(self):
         self.shader_list.clear()
@@ -2312,64 +3195,21 @@ class NodeFlowTool(QtWidgets.QDialog):
             s = get_all_scene_shaders()
             return (s, None) if s else (None, "No supported shaders in scene.")
 
-    def _populate_table(self, data):
-        self.table.setRowCount(0)
-        for entry in data:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            mode = entry["transfer_mode"]
-            mode_label = "🔗 Texture" if mode == "texture" else "🔢 Value"
-            if mode == "texture":
-                src_val = entry["source_plug"] or "—"
-            else:
-                v = entry["raw_value"]
-                src_val = str(v[0]) if (
-                    isinstance(v, list) and v and isinstance(v[0], tuple)
-                ) else str(v)
-            status = ""
-            if mode == "texture":
-                if entry["file_node"] and not entry["file_path"]:
-                    status = "⚠ No path"
-                elif entry["source_node"] and \
-                        cmds.nodeType(entry["source_node"]) in NODE_CONVERSION_TABLE:
-                    status = "🔄 Will convert"
-                else:
-                    status = "✓"
-            else:
-                status = "✓"
-
-            cols = [
-                entry["shader"],
-                entry["shader_attr"],
-                mode_label,
-                src_val,
-                entry["file_node"] or ("—" if mode == "texture" else "n/a"),
-                entry["tgt_attr"],
-                status,
-            ]
-            colors = {
-                0: "#4080d0",
-                1: "#7aa2c8",
-                2: "#88cc88" if mode == "texture" else "#ccaa44",
-                5: "#88cc88",
-                6: "#e08040" if "⚠" in status else
-                   "#4488ff" if "convert" in status else "#448844",
-            }
-            for col, val in enumerate(cols):
-                item = QtWidgets.QTableWidgetItem(str(val))
-                if col in colors:
-                    item.setForeground(QtGui.QColor(colors[col]))
-                self.table.setItem(row, col, item)
-
     def _scan(self):
         shaders, err = self._get_source_shaders()
         if err:
             QtWidgets.QMessageBox.warning(self, "NodeFlow", err)
             return
         target_mat   = self.material_combo.currentText()
-        self._all_data = []
-        for shader in shaders:
-            self._all_data += collect_data(shader, target_mat)
+        self._data_by_shader = {}
+        # one cache for the whole batch: shaders often share texture networks
+        with wait_cursor(), traversal_cache():
+            for shader in shaders:
+                data = get_collected_data(shader, target_mat)
+                if data:
+                    self._data_by_shader[shader] = data
+        # flattened once, sized once, instead of growing per shader
+        self._all_data = list(chain.from_iterable(self._data_by_shader.values()))
         if not self._all_data:
             self._log("[WARN] No transferable data found.")
             self.transfer_btn.setEnabled(False)
@@ -2378,9 +3218,14 @@ class NodeFlowTool(QtWidgets.QDialog):
                 "No connected textures or attribute values found."
             )
             return
-        tex = sum(1 for e in self._all_data if e["transfer_mode"] == "texture")
-        val = sum(1 for e in self._all_data if e["transfer_mode"] == "value")
-        self._populate_table(self._all_data)
+        # one pass: every entry is either a texture or a value transfer
+        tex = 0
+        for e in self._all_data:
+            if e.transfer_mode == MODE_TEXTURE:
+                tex += 1
+        val = len(self._all_data) - tex
+        self.table_model.set_entries(self._all_data)
+        self.table.resizeColumnsToContents()
         self.transfer_btn.setEnabled(True)
         self._log(
             f"[SCAN] {len(shaders)} shader(s) — "
@@ -2388,17 +3233,21 @@ class NodeFlowTool(QtWidgets.QDialog):
         )
 
     def _transfer(self):
+        # snapshot the widgets once; nothing below reads them again
+        renderer    = self.renderer_combo.currentText()
         target_mat  = self.material_combo.currentText()
         tgt_input   = self.tgt_field.text().strip()
         mash_waiter = self.mash_field.text().strip() \
-                      if self.renderer_combo.currentText() == "MASH" else None
+                      if renderer == "MASH" else None
 
         shaders, err = self._get_source_shaders()
         if err:
             QtWidgets.QMessageBox.warning(self, "NodeFlow", err)
             return
 
-        tgt_val  = tgt_input if tgt_input and cmds.objExists(tgt_input) else None
+        # queried once: the loop below never deletes or renames the target
+        tgt_exists = bool(tgt_input) and cmds.objExists(tgt_input)
+        tgt_val  = tgt_input if tgt_exists else None
         warnings = validate_transfer(self._all_data, tgt_val, target_mat)
         if warnings:
             dlg = WarningDialog(warnings, parent=self)
@@ -2407,40 +3256,51 @@ class NodeFlowTool(QtWidgets.QDialog):
                 self._log("[CANCELLED]")
                 return
 
-        data_by_shader = defaultdict(list)
-        for entry in self._all_data:
-            data_by_shader[entry["shader"]].append(entry)
+        data_by_shader = self._data_by_shader   # grouped once in _scan
 
         total_ok = total_fail = total_assigned = 0
-
-        for shader, entries in data_by_shader.items():
-            if target_mat == "MASH":
-                target_node = None
-            elif tgt_input and cmds.objExists(tgt_input):
-                target_node = tgt_input
-            else:
-                target_node = create_target_shader(target_mat, shader)
-                if target_node:
-                    self._log(f"[CREATE] '{target_node}' for '{shader}'")
+        converted_cache = {}   # shared by all shaders: same target renderer
+        # SG memberships of the source shaders, gathered once for the batch
+        shading_index = ShadingIndex() \
+            if target_mat != "MASH" and len(data_by_shader) > 1 else None
+
+        out = []   # whole batch's log, appended to the widget once
+        # one undo step for the whole batch, viewport refresh suspended
+        with wait_cursor(), batch_edit("NodeFlow Transfer"):
+            for shader, entries in data_by_shader.items():
+                if target_mat == "MASH":
+                    target_node = None
+                elif tgt_exists:
+                    target_node = tgt_input
                 else:
-                    self._log(
-                        f"[ERROR] Could not create '{target_mat}' — plugin loaded?"
-                    )
-                    continue
-
-            log_lines = do_transfer(entries, target_node, target_mat, mash_waiter)
-            for line in log_lines:
-                self._log(line)
-
-            total_ok   += sum(1 for l in log_lines if l.startswith("[OK"))
-            total_fail += sum(1 for l in log_lines if l.startswith("[FAIL]"))
-
-            if target_node and target_mat != "MASH":
-                n = assign_shader_to_meshes(target_node, shader, log_lines)
-                total_assigned += n
-                for line in log_lines:
-                    if "[ASSIGN]" in line:
-                        self._log(line)
+                    target_node = create_target_shader(target_mat, shader)
+                    if target_node:
+                        out.append(f"[CREATE] '{target_node}' for '{shader}'")
+                    else:
+                        out.append(
+                            f"[ERROR] Could not create '{target_mat}' — plugin loaded?"
+                        )
+                        continue
+
+                log_lines = do_transfer(entries, target_node, target_mat, mash_waiter,
+                                        converted_cache)
+                out.extend(log_lines)
+                for line in log_lines:   # one pass for both tallies
+                    if line.startswith("[OK"):
+                        total_ok += 1
+                    elif line.startswith("[FAIL]"):
+                        total_fail += 1
+
+                if target_node and target_mat != "MASH":
+                    # own list: only its [ASSIGN] lines are shown, and the
+                    # transfer lines above are not rescanned
+                    assign_log = []
+                    total_assigned += assign_shader_to_meshes(
+                        target_node, shader, assign_log, shading_index)
+                    out.extend(l for l in assign_log if "[ASSIGN]" in l)
+
+        if out:
+            self._log("\n".join(out))
 
         self._log(
             f"\n{'─'*60}\n"